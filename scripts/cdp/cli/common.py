@@ -0,0 +1,247 @@
+"""
+Helpers shared by the CLI subcommand modules.
+"""
+
+import argparse
+import functools
+import json
+import logging
+import sys
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Optional,
+    TypeVar,
+)
+
+from ..exceptions import CDPError, CDPTargetNotFoundError
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from ..connection import CDPConnection
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+AsyncHandler = Callable[[argparse.Namespace], Coroutine[Any, Any, int]]
+
+# Connection opened once by the repl subcommand and reused by every command
+# it runs that does not pick its own --target/--url
+shared_connection: ContextVar[Optional["CDPConnection"]] = ContextVar(
+    "shared_connection", default=None
+)
+
+
+def loop_factory() -> Optional[Callable[[], "asyncio.AbstractEventLoop"]]:
+    """
+    Return the event loop factory subcommands run on.
+
+    Imported on first use rather than at module level, so building the
+    parser (e.g. for --help) does not load asyncio or uvloop.
+
+    Returns:
+        uvloop.new_event_loop when uvloop is installed, else None for
+        asyncio's default loop
+    """
+    try:
+        import uvloop  # pylint: disable=import-outside-toplevel
+    except ImportError:  # optional speedup, use the default asyncio loop
+        return None
+    return uvloop.new_event_loop
+
+
+def _orjson() -> Any:
+    """
+    Return the orjson module, or None when it is not installed.
+
+    Imported on first use like uvloop in loop_factory(); orjson pulls in
+    uuid and zoneinfo, which would otherwise be loaded by every --help.
+    """
+    try:
+        import orjson  # pylint: disable=import-outside-toplevel
+    except ImportError:  # optional speedup, fall back to stdlib json
+        return None
+    return orjson
+
+
+def run_async(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a subcommand coroutine to completion on a fresh event loop.
+
+    Behaves like asyncio.run(), but the loop comes from loop_factory() so
+    handlers doing websocket round trips run on uvloop when available.
+
+    Args:
+        coro: Coroutine returned by a *_handler_async function
+
+    Returns:
+        The coroutine's result
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    factory = loop_factory()
+    if sys.version_info >= (3, 11):
+        with asyncio.Runner(loop_factory=factory) as runner:
+            return runner.run(coro)
+
+    # Python 3.10: asyncio.run() takes no loop factory
+    if factory is not None:
+        import uvloop  # pylint: disable=import-outside-toplevel
+
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return asyncio.run(coro)
+
+
+def print_json(value: Any, default: Optional[Callable[[Any], Any]] = None) -> None:
+    """
+    Print value to stdout as 2-space indented JSON.
+
+    Uses orjson when installed, which encodes large results (e.g. DOM trees
+    returned by value) much faster and writes UTF-8 bytes without building
+    an intermediate str.
+
+    Args:
+        value: JSON-serializable value
+        default: Called for objects the encoder cannot serialize and must
+            return a serializable replacement (e.g. Target.to_dict)
+    """
+    orjson = _orjson()
+    if orjson is not None:
+        try:
+            data = orjson.dumps(
+                value,
+                default=default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+            )
+        except TypeError:
+            pass  # e.g. integers beyond 64 bits; stdlib json handles those
+        else:
+            sys.stdout.flush()  # keep ordering with any earlier print()
+            sys.stdout.buffer.write(data)
+            sys.stdout.buffer.flush()
+            return
+
+    print(json.dumps(value, indent=2, default=default))
+
+
+def print_value(value: Any) -> None:
+    """
+    Print a Runtime.evaluate result value to stdout for text output.
+
+    Strings are written as-is, encoded straight to stdout's byte buffer so a
+    large string (e.g. outerHTML) is not copied through print(). Other
+    values are printed as compact JSON.
+
+    Args:
+        value: Value returned by value from the page
+    """
+    orjson = _orjson()
+    if isinstance(value, str):
+        data = value.encode("utf-8", errors="replace") + b"\n"
+    elif orjson is not None:
+        try:
+            data = orjson.dumps(value, option=orjson.OPT_APPEND_NEWLINE)
+        except TypeError:
+            data = (json.dumps(value) + "\n").encode("utf-8")
+    else:
+        data = (json.dumps(value) + "\n").encode("utf-8")
+
+    sys.stdout.flush()  # keep ordering with any earlier print()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
+def log_cdp_error(error: CDPError) -> None:
+    """
+    Log a CDPError and its recovery hint as one record.
+
+    The traceback is attached only when debug logging is enabled.
+
+    Args:
+        error: Error raised by a CDP operation
+    """
+    message = str(error)
+    if error.details.get("recovery"):
+        message += f"\nRecovery hint: {error.details['recovery']}"
+    logger.error(message, exc_info=logger.isEnabledFor(logging.DEBUG))
+
+
+def cdp_command(handler: AsyncHandler) -> AsyncHandler:
+    """
+    Decorate an async subcommand handler with the shared CDPError reporting.
+
+    A CDPError escaping the handler is logged with its recovery hint via
+    log_cdp_error, and the handler returns exit code 1.
+
+    Args:
+        handler: *_handler_async function taking the parsed arguments
+
+    Returns:
+        Wrapped handler
+    """
+
+    @functools.wraps(handler)
+    async def wrapper(args: argparse.Namespace) -> int:
+        try:
+            return await handler(args)
+        except CDPError as e:
+            log_cdp_error(e)
+            return 1
+
+    return wrapper
+
+
+@asynccontextmanager
+async def target_connection(args: argparse.Namespace) -> AsyncIterator["CDPConnection"]:
+    """
+    Connect to the target selected by --target/--url for the block's duration.
+
+    Falls back to the first page target when neither option is given, or
+    to the repl's shared connection when one is open.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Yields:
+        Connected CDPConnection, disconnected when the block exits (a shared
+        connection is left open for the next command)
+
+    Raises:
+        CDPTargetNotFoundError: If no target matches --target or --url
+    """
+    conn = shared_connection.get()
+    if conn is not None and conn.is_connected and not (args.target or args.url):
+        yield conn
+        return
+
+    # Deferred so registering subcommands stays cheap
+    from ..session import CDPSession  # pylint: disable=import-outside-toplevel
+
+    session = CDPSession(
+        chrome_host=args.chrome_host,
+        chrome_port=args.chrome_port,
+        timeout=args.timeout,
+    )
+
+    if args.target:
+        target = session.get_target_by_id(args.target)
+        if not target:
+            raise CDPTargetNotFoundError(
+                f"Target not found: {args.target}",
+                target_id=args.target,
+            )
+        conn = await session.connect_to_target(target)
+    elif args.url:
+        conn = await session.connect_to_url(args.url)
+    else:
+        conn = await session.connect_to_first_page()
+
+    async with conn:
+        yield conn
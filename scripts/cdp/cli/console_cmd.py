@@ -5,20 +5,51 @@ Implements 'console stream' command to monitor console messages.
 """
 
 import argparse
-import asyncio
-import sys
+import logging
+from contextlib import AsyncExitStack
 from pathlib import Path
 
-from ..session import CDPSession
-from ..collectors.console import ConsoleCollector
-from ..exceptions import CDPError, CDPTargetNotFoundError
+from .common import cdp_command, run_async, target_connection
 
+logger = logging.getLogger(__name__)
 
+# Write buffer for --output files; entries reach disk in batches of this size
+CONSOLE_WRITE_BUFFER = 1 << 16
+
+# Events Chrome sends when the target goes away (after Inspector.enable)
+TARGET_GONE_EVENTS = ("Inspector.detached", "Inspector.targetCrashed")
+
+# Examples shown by 'console --help'
+_CONSOLE_EPILOG = """
+Examples:
+  # Stream console logs for 60 seconds
+  browser-debugger console stream --duration 60
+
+  # Stream from specific target
+  browser-debugger console stream --target <target-id> --duration 30
+
+  # Stream from target matching URL
+  browser-debugger console stream --url example.com --duration 60
+
+  # Filter by level
+  browser-debugger console stream --duration 60 --level error
+
+  # Save to custom file
+  browser-debugger console stream --duration 60 --output console.jsonl
+
+  # Stop after the first 10 errors
+  browser-debugger console stream --duration 60 --level error --max-messages 10
+"""
+
+
+@cdp_command
 async def console_stream_handler_async(args: argparse.Namespace) -> int:
     """
     Handle 'console stream' command (async implementation).
 
-    Streams console logs from target for specified duration.
+    Streams console logs from target for specified duration, ending early
+    once --max-messages entries were captured or the target detaches or
+    crashes.
 
     Args:
         args: Parsed command-line arguments
@@ -26,102 +57,55 @@ async def console_stream_handler_async(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    try:
-        # Create CDP session
-        session = CDPSession(
-            chrome_host=args.chrome_host,
-            chrome_port=args.chrome_port,
-            timeout=args.timeout,
-        )
-
-        # Find target
-        if args.target:
-            target = session.get_target_by_id(args.target)
-            if not target:
-                raise CDPTargetNotFoundError(
-                    f"Target not found: {args.target}",
-                    target_id=args.target,
-                )
-        elif args.url:
-            targets = session.list_targets(target_type="page", url_pattern=args.url)
-            if not targets:
-                raise CDPTargetNotFoundError(
-                    f"No page target matching URL: {args.url}",
-                    url_pattern=args.url,
-                )
-            target = targets[0]
-        else:
-            conn = await session.connect_to_first_page()
-            async with conn:
-                # Create console collector
-                collector = ConsoleCollector(
-                    connection=conn,
-                    output_path=(
-                        Path(args.output)
-                        if hasattr(args, "output") and args.output
-                        else None
-                    ),
-                    level_filter=args.level if hasattr(args, "level") else None,
-                )
-
-                # Context manager handles start/stop automatically
-                async with collector:
-                    # Stream for specified duration
-                    if not args.quiet:
-                        print(
-                            f"Streaming console logs for {args.duration} seconds...",
-                            file=sys.stderr,
-                        )
-
-                    await asyncio.sleep(args.duration)
-
-                if not args.quiet and collector.output_path:
-                    print(
-                        f"Console logs saved to: {collector.output_path}",
-                        file=sys.stderr,
-                    )
-
-            return 0
-
-        # Connect to target
-        conn = await session.connect_to_target(target)
-        async with conn:
-            # Create console collector
-            collector = ConsoleCollector(
-                connection=conn,
-                output_path=(
-                    Path(args.output)
-                    if hasattr(args, "output") and args.output
-                    else None
-                ),
-                level_filter=args.level if hasattr(args, "level") else None,
+    # Deferred so registering the subcommand stays cheap
+    # pylint: disable=import-outside-toplevel
+    from ..collectors.console import ConsoleCollector
+
+    output_path = Path(args.output) if args.output else None
+
+    async with AsyncExitStack() as stack:
+        conn = await stack.enter_async_context(target_connection(args))
+
+        output_file = None
+        if output_path:
+            # Entries are appended as they arrive instead of buffered
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            # The exit stack owns the file and closes it after the collector
+            output_file = stack.enter_context(
+                # pylint: disable-next=consider-using-with
+                open(output_path, "ab", buffering=CONSOLE_WRITE_BUFFER)
             )
 
-            # Context manager handles start/stop automatically
-            async with collector:
-                # Stream for specified duration
-                if not args.quiet:
-                    print(
-                        f"Streaming console logs for {args.duration} seconds...",
-                        file=sys.stderr,
-                    )
+        # Create console collector
+        collector = ConsoleCollector(
+            connection=conn,
+            output_path=output_path,
+            level_filter=args.level,
+            output_file=output_file,
+            max_entries=args.max_messages,
+        )
+
+        async def on_target_gone(_params: dict) -> None:
+            collector.done.set()
 
-                await asyncio.sleep(args.duration)
+        async with collector:
+            await conn.execute_command("Inspector.enable")
+            for event in TARGET_GONE_EVENTS:
+                conn.subscribe(event, on_target_gone)
+            try:
+                # Stream for specified duration unless the collector finishes first
+                logger.info("Streaming console logs for %s seconds...", args.duration)
 
-            if not args.quiet and collector.output_path:
-                print(
-                    f"Console logs saved to: {collector.output_path}", file=sys.stderr
-                )
+                if await collector.wait(args.duration):
+                    logger.info("Console stream ended before %s seconds", args.duration)
+            finally:
+                for event in TARGET_GONE_EVENTS:
+                    conn.unsubscribe(event, on_target_gone)
 
-        return 0
+    if output_path:
+        logger.info("Console logs saved to: %s", output_path)
 
-    except CDPError as e:
-        if hasattr(args, "config") and args.config.log_level.upper() == "DEBUG":
-            raise
-        print(f"Error: {e}", file=sys.stderr)
-        if e.details.get("recovery"):
-            print(f"Recovery hint: {e.details['recovery']}", file=sys.stderr)
-        return 1
+    return 0
 
 
 def console_stream_handler(args: argparse.Namespace) -> int:
@@ -134,7 +118,7 @@ def console_stream_handler(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    return asyncio.run(console_stream_handler_async(args))
+    return run_async(console_stream_handler_async(args))
 
 
 def register_subcommand(
@@ -152,23 +136,7 @@ def register_subcommand(
         parents=[parent],
         help="Stream console logs",
         description="Monitor and record console messages from a target",
-        epilog="""
-Examples:
-  # Stream console logs for 60 seconds
-  browser-debugger console stream --duration 60
-
-  # Stream from specific target
-  browser-debugger console stream --target <target-id> --duration 30
-
-  # Stream from target matching URL
-  browser-debugger console stream --url example.com --duration 60
-
-  # Filter by level
-  browser-debugger console stream --duration 60 --level error
-
-  # Save to custom file
-  browser-debugger console stream --duration 60 --output console.jsonl
-        """,
+        epilog=_CONSOLE_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -208,5 +176,14 @@ Examples:
         help="Output file path for console logs (JSONL format)",
     )
 
+    # Message quota
+    console_parser.add_argument(
+        "--max-messages",
+        type=int,
+        help="Stop after capturing this many messages (default: run for --duration)",
+    )
+
     # Set handler function
-    console_parser.set_defaults(func=console_stream_handler)
+    console_parser.set_defaults(
+        func=console_stream_handler, func_async=console_stream_handler_async
+    )
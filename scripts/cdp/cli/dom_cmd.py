@@ -5,146 +5,209 @@ Implements 'dom dump' command to extract HTML via Runtime.evaluate.
 """
 
 import argparse
+import base64
 import json
-import sys
+import logging
 from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+
+from .common import cdp_command, run_async, target_connection
+from ..exceptions import CDPCommandError
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    from ..connection import CDPConnection
+
+# Bytes requested per IO.read call when streaming the DOM to disk
+DOM_READ_CHUNK_SIZE = 1 << 20
+
+# Characters encoded per write when the DOM arrives as one string
+DOM_WRITE_CHUNK_CHARS = 1 << 18
+
+# Wraps the page HTML in a Blob that IO.read can stream
+_BLOB_EXPR = "new Blob([document.documentElement.outerHTML])"
+
+# Promise resolving once a selector matches (args: selector JS literal,
+# timeout in ms). A MutationObserver re-checks the selector only when the
+# DOM actually changes, instead of polling on a timer.
+_WAIT_TMPL = """
+new Promise((resolve, reject) => {
+    const selector = %s;
+    if (document.querySelector(selector)) {
+        resolve(true);
+        return;
+    }
+    const observer = new MutationObserver(() => {
+        if (document.querySelector(selector)) {
+            observer.disconnect();
+            clearTimeout(timer);
+            resolve(true);
+        }
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+    const timer = setTimeout(() => {
+        observer.disconnect();
+        reject(new Error('Selector not found: ' + selector));
+    }, %d);
+})
+"""
 
-from ..session import CDPSession
-from ..exceptions import CDPError, CDPTargetNotFoundError
+# Examples shown by 'dom --help'
+_DOM_EPILOG = """
+Examples:
+  # Dump DOM from first page
+  browser-debugger dom dump --output dom.html
 
+  # Dump DOM from specific target
+  browser-debugger dom dump --target <target-id> --output dom.html
 
-async def dom_dump_handler_async(args: argparse.Namespace) -> int:
-    """
-    Handle 'dom dump' command (async implementation).
+  # Dump DOM from target matching URL
+  browser-debugger dom dump --url example.com --output dom.html
 
-    Extracts DOM from target via Runtime.evaluate.
+  # Wait for element before dumping
+  browser-debugger dom dump --url example.com --wait-for "#content" --output dom.html
+"""
+
+
+def _wait_for_selector_expression(selector: str, timeout: float) -> str:
+    """
+    Build a JavaScript promise that resolves once selector matches an element.
 
     Args:
-        args: Parsed command-line arguments
+        selector: CSS selector to wait for
+        timeout: Seconds before the promise rejects
 
     Returns:
-        Exit code (0 for success, non-zero for errors)
+        JavaScript expression for Runtime.evaluate with awaitPromise
     """
-    try:
-        # Create CDP session
-        session = CDPSession(
-            chrome_host=args.chrome_host,
-            chrome_port=args.chrome_port,
-            timeout=args.timeout,
+    # json.dumps gives a JS string literal, so quotes, backslashes and
+    # newlines in the selector cannot break out of the expression
+    return _WAIT_TMPL % (json.dumps(selector), int(timeout * 1000))
+
+
+def _write_html(output_path: Path, html: str) -> None:
+    """
+    Write html to output_path as UTF-8, encoding one slice at a time.
+
+    Avoids holding a full encoded copy of a multi-MB DOM next to the str.
+
+    Args:
+        output_path: File to write
+        html: Page HTML
+    """
+    with open(output_path, "wb") as f:
+        for start in range(0, len(html), DOM_WRITE_CHUNK_CHARS):
+            f.write(html[start : start + DOM_WRITE_CHUNK_CHARS].encode("utf-8"))
+
+
+async def save_dom(
+    conn: "CDPConnection",
+    output_path: Path,
+    wait_for: Optional[str] = None,
+    timeout: float = 30.0,
+) -> None:
+    """
+    Write the page's outerHTML to output_path.
+
+    The HTML is wrapped in a Blob and pulled through IO.read in chunks, so
+    a large DOM never has to travel as one JSON-escaped string value. Falls
+    back to returnByValue when the browser rejects the blob stream.
+
+    Args:
+        conn: Connected CDPConnection
+        output_path: File to write the HTML to
+        wait_for: Optional CSS selector to wait for before capturing; the
+            wait is chained into the same Runtime.evaluate as the capture
+        timeout: Seconds to wait for the selector
+    """
+    expression = _BLOB_EXPR
+    if wait_for:
+        expression = (
+            f"({_wait_for_selector_expression(wait_for, timeout)})"
+            f".then(() => {_BLOB_EXPR})"
         )
 
-        # Find target
-        if args.target:
-            target = session.get_target_by_id(args.target)
-            if not target:
-                raise CDPTargetNotFoundError(
-                    f"Target not found: {args.target}",
-                    target_id=args.target,
-                )
-        elif args.url:
-            targets = session.list_targets(target_type="page", url_pattern=args.url)
-            if not targets:
-                raise CDPTargetNotFoundError(
-                    f"No page target matching URL: {args.url}",
-                    url_pattern=args.url,
-                )
-            target = targets[0]
+    result = await conn.execute_command(
+        "Runtime.evaluate", {"expression": expression, "awaitPromise": True}
+    )
+    object_id = result["result"].get("objectId")
+
+    blob = None
+    if object_id is not None:
+        release = ("Runtime.releaseObject", {"objectId": object_id})
+        if "exceptionDetails" in result:
+            # A selector timeout rejects the promise; the page is still dumped
+            await conn.execute_command(*release)
         else:
-            # Use first page
-            conn = await session.connect_to_first_page()
-            async with conn:
-                # Wait for selector if specified
-                if args.wait_for:
-                    # Escape selector for safe JavaScript embedding
-                    escaped_selector = json.dumps(args.wait_for)
-                    wait_expr = f"""
-                    new Promise((resolve, reject) => {{
-                        const timeout = setTimeout(() => reject(new Error('Selector not found: ' + {escaped_selector})), {args.timeout * 1000});
-                        const interval = setInterval(() => {{
-                            if (document.querySelector({escaped_selector})) {{
-                                clearInterval(interval);
-                                clearTimeout(timeout);
-                                resolve(true);
-                            }}
-                        }}, 100);
-                    }})
-                    """
-                    await conn.execute_command(
-                        "Runtime.evaluate",
-                        {"expression": wait_expr, "awaitPromise": True},
-                    )
-
-                # Extract DOM
-                result = await conn.execute_command(
-                    "Runtime.evaluate",
-                    {
-                        "expression": "document.documentElement.outerHTML",
-                        "returnByValue": True,
-                    },
+            # Chrome runs a session's commands in order, so the object is
+            # released only after IO.resolveBlob has its own reference to the
+            # blob; pipelining both saves a round trip
+            try:
+                blob, _ = await conn.execute_many(
+                    [("IO.resolveBlob", {"objectId": object_id}), release]
                 )
+            except CDPCommandError:
+                pass  # blob streaming unsupported, fall back below
+
+    if blob is None:
+        result = await conn.execute_command(
+            "Runtime.evaluate",
+            {
+                "expression": "document.documentElement.outerHTML",
+                "returnByValue": True,
+            },
+        )
+        # A multi-MB encode and write would otherwise stall the event loop
+        # (and any collector still receiving events on this connection).
+        # asyncio is imported here so registering the subcommand stays cheap
+        import asyncio  # pylint: disable=import-outside-toplevel
+
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(
+            None, _write_html, output_path, result["result"]["value"]
+        )
+        return
 
-                html = result["result"]["value"]
-
-                # Write to file
-                output_path = Path(args.output)
-                output_path.write_text(html, encoding="utf-8")
-
-                if not args.quiet:
-                    print(f"DOM saved to: {output_path}", file=sys.stderr)
-
-            return 0
-
-        # Connect to target
-        conn = await session.connect_to_target(target)
-        async with conn:
-            # Wait for selector if specified
-            if args.wait_for:
-                # Escape selector for safe JavaScript embedding
-                escaped_selector = json.dumps(args.wait_for)
-                wait_expr = f"""
-                new Promise((resolve, reject) => {{
-                    const timeout = setTimeout(() => reject(new Error('Selector not found: ' + {escaped_selector})), {args.timeout * 1000});
-                    const interval = setInterval(() => {{
-                        if (document.querySelector({escaped_selector})) {{
-                            clearInterval(interval);
-                            clearTimeout(timeout);
-                            resolve(true);
-                        }}
-                    }}, 100);
-                }})
-                """
-                await conn.execute_command(
-                    "Runtime.evaluate",
-                    {"expression": wait_expr, "awaitPromise": True},
+    handle = f"blob:{blob['uuid']}"
+    try:
+        with open(output_path, "wb") as f:
+            while True:
+                chunk = await conn.execute_command(
+                    "IO.read", {"handle": handle, "size": DOM_READ_CHUNK_SIZE}
                 )
+                data = chunk.get("data", "")
+                if chunk.get("base64Encoded"):
+                    f.write(base64.b64decode(data))
+                else:
+                    f.write(data.encode("utf-8"))
+                if chunk.get("eof"):
+                    break
+    finally:
+        await conn.execute_command("IO.close", {"handle": handle})
+
+
+@cdp_command
+async def dom_dump_handler_async(args: argparse.Namespace) -> int:
+    """
+    Handle 'dom dump' command (async implementation).
 
-            # Extract DOM
-            result = await conn.execute_command(
-                "Runtime.evaluate",
-                {
-                    "expression": "document.documentElement.outerHTML",
-                    "returnByValue": True,
-                },
-            )
-
-            html = result["result"]["value"]
+    Extracts DOM from target via Runtime.evaluate.
 
-            # Write to file
-            output_path = Path(args.output)
-            output_path.write_text(html, encoding="utf-8")
+    Args:
+        args: Parsed command-line arguments
 
-            if not args.quiet:
-                print(f"DOM saved to: {output_path}", file=sys.stderr)
+    Returns:
+        Exit code (0 for success, non-zero for errors)
+    """
+    async with target_connection(args) as conn:
+        # Extract DOM straight to file, once --wait-for matches
+        output_path = Path(args.output)
+        await save_dom(conn, output_path, args.wait_for, args.timeout)
 
-        return 0
+        logger.info("DOM saved to: %s", output_path)
 
-    except CDPError as e:
-        if hasattr(args, "config") and args.config.log_level.upper() == "DEBUG":
-            raise
-        print(f"Error: {e}", file=sys.stderr)
-        if e.details.get("recovery"):
-            print(f"Recovery hint: {e.details['recovery']}", file=sys.stderr)
-        return 1
+    return 0
 
 
 def dom_dump_handler(args: argparse.Namespace) -> int:
@@ -157,9 +220,7 @@ def dom_dump_handler(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    import asyncio
-
-    return asyncio.run(dom_dump_handler_async(args))
+    return run_async(dom_dump_handler_async(args))
 
 
 def register_subcommand(
@@ -177,20 +238,7 @@ def register_subcommand(
         parents=[parent],
         help="Extract DOM from a page",
         description="Extract page DOM via Runtime.evaluate",
-        epilog="""
-Examples:
-  # Dump DOM from first page
-  browser-debugger dom dump --output dom.html
-
-  # Dump DOM from specific target
-  browser-debugger dom dump --target <target-id> --output dom.html
-
-  # Dump DOM from target matching URL
-  browser-debugger dom dump --url example.com --output dom.html
-
-  # Wait for element before dumping
-  browser-debugger dom dump --url example.com --wait-for "#content" --output dom.html
-        """,
+        epilog=_DOM_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -223,4 +271,4 @@ Examples:
     )
 
     # Set handler function
-    dom_parser.set_defaults(func=dom_dump_handler)
+    dom_parser.set_defaults(func=dom_dump_handler, func_async=dom_dump_handler_async)
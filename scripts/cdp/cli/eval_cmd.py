@@ -5,13 +5,39 @@ Implements 'eval' command to execute JavaScript expressions via Runtime.evaluate
 """
 
 import argparse
-import json
-import sys
+import logging
 
-from ..session import CDPSession
-from ..exceptions import CDPError, CDPTargetNotFoundError
+from .common import (
+    cdp_command,
+    print_json,
+    print_value,
+    run_async,
+    target_connection,
+)
 
+logger = logging.getLogger(__name__)
 
+# Examples shown by 'eval --help'
+_EVAL_EPILOG = """
+Examples:
+  # Evaluate in first page
+  browser-debugger eval "document.title"
+
+  # Evaluate in specific target
+  browser-debugger eval --target <target-id> "window.location.href"
+
+  # Evaluate in target matching URL
+  browser-debugger eval --url example.com "document.querySelector('h1').textContent"
+
+  # Wait for promise resolution
+  browser-debugger eval --await "fetch('/api/data').then(r => r.json())"
+
+  # JSON output
+  browser-debugger eval --format json "document.querySelector('h1').textContent"
+"""
+
+
+@cdp_command
 async def eval_handler_async(args: argparse.Namespace) -> int:
     """
     Handle 'eval' command (async implementation).
@@ -24,93 +50,27 @@ async def eval_handler_async(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    try:
-        # Create CDP session
-        session = CDPSession(
-            chrome_host=args.chrome_host,
-            chrome_port=args.chrome_port,
-            timeout=args.timeout,
+    async with target_connection(args) as conn:
+        result = await conn.execute_command(
+            "Runtime.evaluate",
+            {
+                "expression": args.expression,
+                "returnByValue": True,
+                "awaitPromise": args.await_promise,
+            },
         )
 
-        # Find target
-        if args.target:
-            # Connect by target ID
-            target = session.get_target_by_id(args.target)
-            if not target:
-                raise CDPTargetNotFoundError(
-                    f"Target not found: {args.target}",
-                    target_id=args.target,
-                )
-        elif args.url:
-            # Find target by URL pattern
-            targets = session.list_targets(target_type="page", url_pattern=args.url)
-            if not targets:
-                raise CDPTargetNotFoundError(
-                    f"No page target matching URL: {args.url}",
-                    url_pattern=args.url,
-                )
-            target = targets[0]  # Use first match
+        # Output result
+        if args.format == "json":
+            print_json(result)
         else:
-            # Use first page target
-            conn = await session.connect_to_first_page()
-            async with conn:
-                result = await conn.execute_command(
-                    "Runtime.evaluate",
-                    {
-                        "expression": args.expression,
-                        "returnByValue": True,
-                        "awaitPromise": args.await_promise,
-                    },
-                )
-
-                # Output result
-                if args.format == "json":
-                    print(json.dumps(result, indent=2))
-                else:
-                    if "result" in result and "value" in result["result"]:
-                        print(result["result"]["value"])
-                    elif "exceptionDetails" in result:
-                        print(
-                            f"Error: {result['exceptionDetails']['text']}",
-                            file=sys.stderr,
-                        )
-                        return 1
-
-            return 0
-
-        # Connect to target
-        conn = await session.connect_to_target(target)
-        async with conn:
-            result = await conn.execute_command(
-                "Runtime.evaluate",
-                {
-                    "expression": args.expression,
-                    "returnByValue": True,
-                    "awaitPromise": args.await_promise,
-                },
-            )
-
-            # Output result
-            if args.format == "json":
-                print(json.dumps(result, indent=2))
-            else:
-                if "result" in result and "value" in result["result"]:
-                    print(result["result"]["value"])
-                elif "exceptionDetails" in result:
-                    print(
-                        f"Error: {result['exceptionDetails']['text']}", file=sys.stderr
-                    )
-                    return 1
-
-        return 0
-
-    except CDPError as e:
-        if hasattr(args, "config") and args.config.log_level.upper() == "DEBUG":
-            raise
-        print(f"Error: {e}", file=sys.stderr)
-        if e.details.get("recovery"):
-            print(f"Recovery hint: {e.details['recovery']}", file=sys.stderr)
-        return 1
+            if "result" in result and "value" in result["result"]:
+                print_value(result["result"]["value"])
+            elif "exceptionDetails" in result:
+                logger.error(result["exceptionDetails"]["text"])
+                return 1
+
+    return 0
 
 
 def eval_handler(args: argparse.Namespace) -> int:
@@ -123,9 +83,7 @@ def eval_handler(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    import asyncio
-
-    return asyncio.run(eval_handler_async(args))
+    return run_async(eval_handler_async(args))
 
 
 def register_subcommand(
@@ -143,23 +101,7 @@ def register_subcommand(
         parents=[parent],
         help="Execute JavaScript in a target",
         description="Execute JavaScript expression via Runtime.evaluate",
-        epilog="""
-Examples:
-  # Evaluate in first page
-  browser-debugger eval "document.title"
-
-  # Evaluate in specific target
-  browser-debugger eval --target <target-id> "window.location.href"
-
-  # Evaluate in target matching URL
-  browser-debugger eval --url example.com "document.querySelector('h1').textContent"
-
-  # Wait for promise resolution
-  browser-debugger eval --await "fetch('/api/data').then(r => r.json())"
-
-  # JSON output
-  browser-debugger eval --format json "document.querySelector('h1').textContent"
-        """,
+        epilog=_EVAL_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -186,4 +128,4 @@ Examples:
     )
 
     # Set handler function
-    eval_parser.set_defaults(func=eval_handler)
+    eval_parser.set_defaults(func=eval_handler, func_async=eval_handler_async)
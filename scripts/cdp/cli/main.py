@@ -14,13 +14,62 @@ Subcommands:
     network     - Record network activity
     orchestrate - Run automated debugging workflow
     query       - Execute arbitrary CDP commands
+    repl        - Run several commands over one connection
 """
 
 import argparse
+import importlib
+import logging
 import sys
+from functools import lru_cache
 from typing import List, Optional
-from scripts.cdp.config import Configuration
-from scripts.cdp.logging_setup import setup_logging
+
+# Named explicitly: under "python -m" __name__ is "__main__", outside the
+# scripts.cdp.cli logger hierarchy
+logger = logging.getLogger("scripts.cdp.cli.main")
+
+# Subcommand name -> help line, in --help order. Each is implemented by
+# the module scripts.cdp.cli.<name>_cmd.
+SUBCOMMANDS = {
+    "session": "List and inspect Chrome targets",
+    "eval": "Execute JavaScript in a target",
+    "dom": "Extract DOM from a page",
+    "console": "Stream console logs",
+    "network": "Record network activity",
+    "orchestrate": "Run automated debugging workflow",
+    "query": "Execute arbitrary CDP command",
+    "repl": "Run several commands over one connection",
+}
+
+# Examples shown by 'browser-debugger --help'
+_MAIN_EPILOG = """
+Examples:
+  # List all page targets
+  browser-debugger session list --type page
+
+  # Execute JavaScript
+  browser-debugger eval --url example.com "document.title"
+
+  # Extract DOM
+  browser-debugger dom dump --url example.com --output dom.html
+
+  # Stream console logs for 60 seconds
+  browser-debugger console stream --url example.com --duration 60
+
+  # Record network activity
+  browser-debugger network record --url example.com --duration 30 --include-bodies
+
+  # Run automated debugging workflow
+  browser-debugger orchestrate headless https://example.com --include-console
+
+  # Execute arbitrary CDP command
+  browser-debugger query --target <target-id> --method Runtime.evaluate --params '{"expression":"document.title"}'
+
+  # Run several commands over one connection
+  browser-debugger repl --url example.com
+
+For more information on subcommands, run: browser-debugger <subcommand> --help
+"""
 
 
 def create_parent_parser() -> argparse.ArgumentParser:
@@ -91,12 +140,25 @@ def create_parent_parser() -> argparse.ArgumentParser:
     return parent
 
 
-def create_main_parser(parent: argparse.ArgumentParser) -> argparse.ArgumentParser:
+def create_main_parser(
+    parent: Optional[argparse.ArgumentParser],
+    subcommand: Optional[str] = None,
+    stubs_only: bool = False,
+) -> argparse.ArgumentParser:
     """
-    Create main parser with all subcommands.
+    Create main parser with subcommands.
+
+    Subcommand modules are imported on demand, so a parser for one
+    subcommand does not pay for the imports of the others, nor for copying
+    the global options into their subparsers. The one subcommand that is
+    registered still gets the full parent options in its own --help.
 
     Args:
-        parent: Parent parser with global options
+        parent: Parent parser with global options (may be None with
+            stubs_only, since stub subparsers do not inherit it)
+        subcommand: Only import and register this subcommand (None = all)
+        stubs_only: Register every subcommand as a bare name/help parser
+            without importing its module
 
     Returns:
         Main ArgumentParser with subcommands configured
@@ -105,31 +167,7 @@ def create_main_parser(parent: argparse.ArgumentParser) -> argparse.ArgumentPars
         prog="browser-debugger",
         description="Chrome DevTools Protocol (CDP) debugging tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  # List all page targets
-  browser-debugger session list --type page
-
-  # Execute JavaScript
-  browser-debugger eval --url example.com "document.title"
-
-  # Extract DOM
-  browser-debugger dom dump --url example.com --output dom.html
-
-  # Stream console logs for 60 seconds
-  browser-debugger console stream --url example.com --duration 60
-
-  # Record network activity
-  browser-debugger network record --url example.com --duration 30 --include-bodies
-
-  # Run automated debugging workflow
-  browser-debugger orchestrate headless https://example.com --include-console
-
-  # Execute arbitrary CDP command
-  browser-debugger query --target <target-id> --method Runtime.evaluate --params '{"expression":"document.title"}'
-
-For more information on subcommands, run: browser-debugger <subcommand> --help
-        """,
+        epilog=_MAIN_EPILOG,
     )
 
     # Create subparsers
@@ -140,29 +178,63 @@ For more information on subcommands, run: browser-debugger <subcommand> --help
         required=True,
     )
 
-    # Import subcommand modules
-    from . import (
-        session_cmd,
-        eval_cmd,
-        dom_cmd,
-        console_cmd,
-        network_cmd,
-        orchestrate_cmd,
-        query_cmd,
-    )
+    if subcommand is not None and subcommand not in SUBCOMMANDS:
+        subcommand = None
 
-    # Wire up subcommands
-    session_cmd.register_subcommand(subparsers, parent)
-    eval_cmd.register_subcommand(subparsers, parent)
-    dom_cmd.register_subcommand(subparsers, parent)
-    console_cmd.register_subcommand(subparsers, parent)
-    network_cmd.register_subcommand(subparsers, parent)
-    orchestrate_cmd.register_subcommand(subparsers, parent)
-    query_cmd.register_subcommand(subparsers, parent)
+    for name, help_text in SUBCOMMANDS.items():
+        if stubs_only:
+            # Name and help are all 'browser-debugger --help' or an
+            # invalid-choice error need, so skip importing the module
+            subparsers.add_parser(name, help=help_text)
+        elif subcommand is None or name == subcommand:
+            module = importlib.import_module(f"{__package__}.{name}_cmd")
+            module.register_subcommand(subparsers, parent)
 
     return parser
 
 
+def find_subcommand(argv: Optional[List[str]]) -> Optional[str]:
+    """
+    Return the subcommand named in argv without parsing it.
+
+    The main parser has no options of its own besides --help, so the
+    subcommand is the first argument if it is one at all.
+
+    Args:
+        argv: Command-line arguments (default: sys.argv[1:])
+
+    Returns:
+        Subcommand name, or None for --help, no arguments or an unknown name
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv and argv[0] in SUBCOMMANDS:
+        return argv[0]
+    return None
+
+
+@lru_cache(maxsize=None)  # keys are limited to SUBCOMMANDS plus None
+def get_parser(
+    subcommand: Optional[str] = None, stubs_only: bool = False
+) -> argparse.ArgumentParser:
+    """
+    Return the main parser, building it once per process.
+
+    main() asks for the parser of the subcommand it is about to run, so
+    repeated main() calls in one process only construct it once.
+
+    Args:
+        subcommand: Only register this subcommand (None = all)
+        stubs_only: Register every subcommand as a stub, for --help and
+            usage errors
+
+    Returns:
+        Main ArgumentParser with subcommands configured
+    """
+    parent = None if stubs_only else create_parent_parser()
+    return create_main_parser(parent, subcommand, stubs_only)
+
+
 def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for CLI.
@@ -176,12 +248,26 @@ def main(argv: Optional[List[str]] = None) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    # Create parsers
-    parent = create_parent_parser()
-    parser = create_main_parser(parent)
+    # Only the invoked subcommand's module is imported; without one
+    # (--help, typo, no arguments) stub parsers cover the error or help text.
+    # Repeated main() calls in one process reuse the built parser.
+    subcommand = find_subcommand(argv)
+    parser = get_parser(subcommand, stubs_only=subcommand is None)
 
     # Parse arguments
     args = parser.parse_args(argv)
+    options = vars(args)
+
+    if options.get("func") is None:
+        # No subcommand provided (should not happen with required=True, but
+        # fallback); nothing to configure
+        parser.print_help()
+        return 1
+
+    # Deferred until argparse is done, so --help and usage errors skip them
+    # pylint: disable=import-outside-toplevel
+    from scripts.cdp.config import Configuration
+    from scripts.cdp.logging_setup import setup_logging
 
     # Load configuration with precedence: CLI > env > file > defaults
     config = Configuration()
@@ -189,46 +275,42 @@ def main(argv: Optional[List[str]] = None) -> int:
     config.load_from_env()  # Override with environment variables
 
     # Merge CLI arguments (highest precedence)
-    cli_overrides = {
-        "chrome_port": args.chrome_port if hasattr(args, "chrome_port") else None,
-        "timeout": args.timeout if hasattr(args, "timeout") else None,
-        "log_level": args.log_level if hasattr(args, "log_level") else None,
-        "log_format": args.format if hasattr(args, "format") else None,
-    }
-    config.merge(**{k: v for k, v in cli_overrides.items() if v is not None})
+    config.merge(
+        chrome_port=options["chrome_port"],
+        timeout=options["timeout"],
+        log_level=options["log_level"],
+        log_format=options["format"],
+    )
 
     # Handle verbosity flags (override log level)
-    if hasattr(args, "quiet") and args.quiet:
+    if options["quiet"]:
         config.log_level = "ERROR"
-    elif hasattr(args, "verbose") and args.verbose:
+    elif options["verbose"]:
         config.log_level = "DEBUG"
 
     # Setup logging with final configuration
     setup_logging(
         format_type=config.log_format,
         level=config.log_level.upper() if isinstance(config.log_level, str) else "INFO",
-        quiet=getattr(args, "quiet", False),
-        verbose=getattr(args, "verbose", False),
+        quiet=options["quiet"],
+        verbose=options["verbose"],
     )
 
+    # Expose the resolved level so repl commands inherit it
+    args.log_level = str(config.log_level).lower()
+
     # Attach config to args for subcommands to access
     args.config = config
 
     # Dispatch to subcommand handler (will be set via set_defaults(func=...) in subcommands)
-    if hasattr(args, "func"):
-        try:
-            return args.func(args)
-        except KeyboardInterrupt:
-            print("\nInterrupted by user", file=sys.stderr)
-            return 130  # Standard exit code for SIGINT
-        except Exception as e:
-            if config.log_level.upper() == "DEBUG":
-                raise  # Re-raise for full traceback in debug mode
-            print(f"Error: {e}", file=sys.stderr)
-            return 1
-    else:
-        # No subcommand provided (should not happen with required=True, but fallback)
-        parser.print_help()
+    try:
+        return args.func(args)
+    except KeyboardInterrupt:
+        print("\nInterrupted by user", file=sys.stderr)
+        return 130  # Standard exit code for SIGINT
+    except Exception as e:
+        # Full traceback only in debug mode
+        logger.error("%s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
         return 1
 
 
@@ -5,15 +5,37 @@ Implements 'network record' command to capture network requests and responses.
 """
 
 import argparse
-import asyncio
-import sys
-from pathlib import Path
+import logging
+from contextlib import AsyncExitStack
 
-from ..session import CDPSession
-from ..collectors.network import NetworkCollector
-from ..exceptions import CDPError, CDPTargetNotFoundError
+from .common import cdp_command, run_async, target_connection
 
+logger = logging.getLogger(__name__)
 
+# Write buffer for --output files; entries reach disk in batches of this size
+NETWORK_WRITE_BUFFER = 1 << 16
+
+# Examples shown by 'network --help'
+_NETWORK_EPILOG = """
+Examples:
+  # Record network activity for 60 seconds
+  browser-debugger network record --duration 60
+
+  # Record from specific target
+  browser-debugger network record --target <target-id> --duration 30
+
+  # Record from target matching URL
+  browser-debugger network record --url example.com --duration 60
+
+  # Include response bodies
+  browser-debugger network record --duration 60 --include-bodies
+
+  # Save to custom file
+  browser-debugger network record --duration 60 --output network.jsonl
+"""
+
+
+@cdp_command
 async def network_record_handler_async(args: argparse.Namespace) -> int:
     """
     Handle 'network record' command (async implementation).
@@ -26,105 +48,47 @@ async def network_record_handler_async(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    try:
-        # Create CDP session
-        session = CDPSession(
-            chrome_host=args.chrome_host,
-            chrome_port=args.chrome_port,
-            timeout=args.timeout,
-        )
-
-        # Find target
-        if args.target:
-            target = session.get_target_by_id(args.target)
-            if not target:
-                raise CDPTargetNotFoundError(
-                    f"Target not found: {args.target}",
-                    target_id=args.target,
-                )
-        elif args.url:
-            targets = session.list_targets(target_type="page", url_pattern=args.url)
-            if not targets:
-                raise CDPTargetNotFoundError(
-                    f"No page target matching URL: {args.url}",
-                    url_pattern=args.url,
-                )
-            target = targets[0]
-        else:
-            conn = await session.connect_to_first_page()
-            async with conn:
-                # Create network collector
-                collector = NetworkCollector(
-                    connection=conn,
-                    output_path=(
-                        Path(args.output)
-                        if hasattr(args, "output") and args.output
-                        else None
-                    ),
-                    include_bodies=(
-                        args.include_bodies
-                        if hasattr(args, "include_bodies")
-                        else False
-                    ),
-                )
-
-                async with collector:
-                    if not args.quiet:
-                        print(
-                            f"Recording network activity for {args.duration} seconds...",
-                            file=sys.stderr,
-                        )
-
-                    await asyncio.sleep(args.duration)
-
-                if not args.quiet and collector.output_path:
-                    print(
-                        f"Network logs saved to: {collector.output_path}",
-                        file=sys.stderr,
-                    )
-
-            return 0
-
-        # Connect to target
-        conn = await session.connect_to_target(target)
-        async with conn:
-            # Create network collector
-            collector = NetworkCollector(
-                connection=conn,
-                output_path=(
-                    Path(args.output)
-                    if hasattr(args, "output") and args.output
-                    else None
-                ),
-                include_bodies=(
-                    args.include_bodies if hasattr(args, "include_bodies") else False
-                ),
+    # Deferred so registering the subcommand stays cheap
+    # pylint: disable=import-outside-toplevel
+    import asyncio
+    from pathlib import Path
+
+    from ..collectors.network import NetworkCollector
+
+    output_path = Path(args.output) if args.output else None
+
+    async with AsyncExitStack() as stack:
+        conn = await stack.enter_async_context(target_connection(args))
+
+        output_file = None
+        if output_path:
+            # Entries are appended as they arrive instead of buffered
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            # The exit stack owns the file and closes it after the collector
+            output_file = stack.enter_context(
+                # pylint: disable-next=consider-using-with
+                open(output_path, "ab", buffering=NETWORK_WRITE_BUFFER)
             )
 
-            async with collector:
-                if not args.quiet:
-                    print(
-                        f"Recording network activity for {args.duration} seconds...",
-                        file=sys.stderr,
-                    )
+        # Create network collector
+        collector = NetworkCollector(
+            connection=conn,
+            output_path=output_path,
+            include_bodies=args.include_bodies,
+            output_file=output_file,
+        )
 
-                await asyncio.sleep(args.duration)
+        async with collector:
+            logger.info(
+                "Recording network activity for %s seconds...", args.duration
+            )
 
-            if not args.quiet and collector.output_path:
-                print(
-                    f"Network logs saved to: {collector.output_path}",
-                    file=sys.stderr,
-                )
+            await asyncio.sleep(args.duration)
 
-        return 0
+        if collector.output_path:
+            logger.info("Network logs saved to: %s", collector.output_path)
 
-    except CDPError as e:
-        if hasattr(args, "config") and args.config.log_level.upper() == "DEBUG":
-            raise
-        print(f"Error: {e}", file=sys.stderr)
-        if e.details.get("recovery"):
-            print(f"Recovery hint: {e.details['recovery']}", file=sys.stderr)
-        return 1
+    return 0
 
 
 def network_record_handler(args: argparse.Namespace) -> int:
@@ -137,7 +101,7 @@ def network_record_handler(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    return asyncio.run(network_record_handler_async(args))
+    return run_async(network_record_handler_async(args))
 
 
 def register_subcommand(
@@ -155,23 +119,7 @@ def register_subcommand(
         parents=[parent],
         help="Record network activity",
         description="Monitor and record network requests and responses from a target",
-        epilog="""
-Examples:
-  # Record network activity for 60 seconds
-  browser-debugger network record --duration 60
-
-  # Record from specific target
-  browser-debugger network record --target <target-id> --duration 30
-
-  # Record from target matching URL
-  browser-debugger network record --url example.com --duration 60
-
-  # Include response bodies
-  browser-debugger network record --duration 60 --include-bodies
-
-  # Save to custom file
-  browser-debugger network record --duration 60 --output network.jsonl
-        """,
+        epilog=_NETWORK_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -214,4 +162,6 @@ Examples:
     )
 
     # Set handler function
-    network_parser.set_defaults(func=network_record_handler)
+    network_parser.set_defaults(
+        func=network_record_handler, func_async=network_record_handler_async
+    )
@@ -5,18 +5,97 @@ Implements 'orchestrate' command to run full headless/headed debugging sessions.
 """
 
 import argparse
-import asyncio
-import sys
+import logging
 import os
-import subprocess
 import json
 import time
 from pathlib import Path
-from datetime import datetime
+from typing import TYPE_CHECKING
 
-from ..session import CDPSession
-from ..collectors.console import ConsoleCollector
-from ..exceptions import CDPError, CDPTargetNotFoundError
+from .common import log_cdp_error, run_async
+from ..exceptions import CDPError
+
+if TYPE_CHECKING:
+    from ..collectors.console import ConsoleCollector
+
+logger = logging.getLogger(__name__)
+
+# Seconds chrome-launcher.sh may take to start Chrome
+LAUNCHER_TIMEOUT = 15
+
+# Seconds Chrome gets to exit after SIGTERM before it is killed
+CHROME_EXIT_GRACE = 2.0
+
+# Layout of the --summary text file; artifact lines are appended after it
+_SUMMARY_RULE = "=" * 50
+_TEXT_SUMMARY = (
+    "Debugging Session Summary\n"
+    f"{_SUMMARY_RULE}\n"
+    "URL: {url}\n"
+    "Mode: {mode}\n"
+    "Duration: {duration}s\n"
+    "Timestamp: {timestamp}\n"
+    "\n"
+    "Artifacts:"
+)
+
+# Examples shown by 'orchestrate --help'
+_ORCHESTRATE_EPILOG = """
+Examples:
+  # Headless session
+  browser-debugger orchestrate headless https://example.com
+
+  # Headed session (interactive)
+  browser-debugger orchestrate headed https://example.com
+
+  # Include console monitoring
+  browser-debugger orchestrate headless https://example.com --include-console
+
+  # Custom duration
+  browser-debugger orchestrate headless https://example.com --duration 60
+
+  # Text summary
+  browser-debugger orchestrate headless https://example.com --summary text
+
+  # JSON + text summaries
+  browser-debugger orchestrate headless https://example.com --summary both
+"""
+
+
+async def _start_console(collector: "ConsoleCollector") -> None:
+    """
+    Start the console collector and report it.
+
+    Args:
+        collector: Collector to start
+    """
+    await collector.start()
+    logger.info("Console monitoring started")
+
+
+async def _stop_chrome(pid: int) -> None:
+    """
+    Terminate the launched Chrome, escalating to SIGKILL if it lingers.
+
+    Signals the process directly rather than spawning kill(1).
+
+    Args:
+        pid: Chrome process ID reported by chrome-launcher.sh
+    """
+    # pylint: disable=import-outside-toplevel
+    import asyncio
+    import signal
+
+    try:
+        os.kill(pid, signal.SIGTERM)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + CHROME_EXIT_GRACE
+        while loop.time() < deadline:
+            await asyncio.sleep(0.05)
+            os.kill(pid, 0)  # raises ProcessLookupError once Chrome exited
+        os.kill(pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass  # Already gone, or no longer ours to signal
 
 
 async def orchestrate_handler_async(args: argparse.Namespace) -> int:
@@ -31,6 +110,14 @@ async def orchestrate_handler_async(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
+    # Deferred so registering the subcommand stays cheap
+    # pylint: disable=import-outside-toplevel
+    import asyncio
+
+    from ..connection import CDPConnection
+    from ..collectors.console import ConsoleCollector
+    from .dom_cmd import save_dom
+
     chrome_pid = None
     artifacts = {}
 
@@ -40,14 +127,10 @@ async def orchestrate_handler_async(args: argparse.Namespace) -> int:
         output_dir.mkdir(parents=True, exist_ok=True)
 
         # Timestamp for unique filenames
-        timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
+        timestamp = time.strftime("%Y%m%d-%H%M%S")  # local time
         session_id = f"{timestamp}-{os.getpid()}"
 
-        if not args.quiet:
-            print(
-                f"Orchestrating {args.mode} session for URL: {args.url}",
-                file=sys.stderr,
-            )
+        logger.info("Orchestrating %s session for URL: %s", args.mode, args.url)
 
         # Launch Chrome via chrome-launcher.sh
         launcher_path = (
@@ -63,23 +146,34 @@ async def orchestrate_handler_async(args: argparse.Namespace) -> int:
                 {"recovery": "Ensure chrome-launcher.sh exists in scripts/core/"},
             )
 
-        launcher_result = subprocess.run(
-            [
-                str(launcher_path),
-                f"--mode={args.mode}",
-                "--port=9222",
-                f"--url={args.url}",
-            ],
-            capture_output=True,
-            text=True,
-            timeout=15,
+        # Run without blocking the event loop while Chrome starts
+        launcher = await asyncio.create_subprocess_exec(
+            str(launcher_path),
+            f"--mode={args.mode}",
+            "--port=9222",
+            f"--url={args.url}",
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
+        try:
+            stdout_bytes, stderr_bytes = await asyncio.wait_for(
+                launcher.communicate(), timeout=LAUNCHER_TIMEOUT
+            )
+        except asyncio.TimeoutError as exc:
+            launcher.kill()
+            await launcher.wait()
+            raise CDPError(
+                f"chrome-launcher.sh timed out after {LAUNCHER_TIMEOUT}s",
+                {"recovery": "Check that Chrome can start on port 9222"},
+            ) from exc
+        launcher_stdout = stdout_bytes.decode(errors="replace")
+        launcher_stderr = stderr_bytes.decode(errors="replace")
 
-        if launcher_result.returncode != 0:
+        if launcher.returncode != 0:
             # launcher writes debug to stderr, JSON to stdout
             # Parse JSON from stdout to get error details
             try:
-                error_data = json.loads(launcher_result.stdout)
+                error_data = json.loads(launcher_stdout)
                 raise CDPError(
                     error_data.get("message", "Chrome launcher failed"),
                     {
@@ -88,14 +182,14 @@ async def orchestrate_handler_async(args: argparse.Namespace) -> int:
                         )
                     },
                 )
-            except json.JSONDecodeError:
+            except json.JSONDecodeError as exc:
                 raise CDPError(
-                    f"Chrome launcher failed: {launcher_result.stderr}",
+                    f"Chrome launcher failed: {launcher_stderr}",
                     {"recovery": "Check chrome-launcher.sh output for details"},
-                )
+                ) from exc
 
         # Parse JSON from stdout (last line contains the JSON)
-        session_data = json.loads(launcher_result.stdout.strip().split("\n")[-1])
+        session_data = json.loads(launcher_stdout.strip().rpartition("\n")[2])
         if session_data.get("status") != "success":
             raise CDPError(
                 f"Chrome launch failed: {session_data.get('message')}",
@@ -105,30 +199,26 @@ async def orchestrate_handler_async(args: argparse.Namespace) -> int:
         chrome_pid = session_data["pid"]
         ws_url = session_data["ws_url"]
 
-        if not args.quiet:
-            print(f"Chrome launched (PID: {chrome_pid})", file=sys.stderr)
-
-        # Connect to Chrome
-        cdp_session = CDPSession(chrome_host="localhost", chrome_port=9222)
-        conn = await cdp_session.connect_to_first_page()
+        logger.info("Chrome launched (PID: %s)", chrome_pid)
 
-        async with conn:
+        # Connect straight to the page the launcher already found, instead
+        # of listing targets again
+        async with CDPConnection(ws_url) as conn:
             # Start console collector if requested
             console_collector = None
+            startup = []
             if args.include_console:
                 console_path = output_dir / f"console-{session_id}.jsonl"
                 console_collector = ConsoleCollector(
                     connection=conn, output_path=console_path
                 )
-                await console_collector.start()
-                if not args.quiet:
-                    print(f"Console monitoring started", file=sys.stderr)
+                startup.append(_start_console(console_collector))
 
-            # Wait for duration
-            if not args.quiet:
-                print(f"Capturing for {args.duration} seconds...", file=sys.stderr)
+            # Wait for duration; the Console.enable round trip runs inside
+            # the capture window rather than before it
+            logger.info("Capturing for %s seconds...", args.duration)
 
-            await asyncio.sleep(args.duration)
+            await asyncio.gather(asyncio.sleep(args.duration), *startup)
 
             # Stop console collector
             if console_collector:
@@ -139,21 +229,11 @@ async def orchestrate_handler_async(args: argparse.Namespace) -> int:
                 ):
                     artifacts["console"] = str(console_collector.output_path)
 
-            # Extract DOM
+            # Extract DOM, streamed to disk the same way as 'dom dump'
             dom_path = output_dir / f"dom-{session_id}.html"
-            dom_result = await conn.execute_command(
-                "Runtime.evaluate",
-                {
-                    "expression": "document.documentElement.outerHTML",
-                    "returnByValue": True,
-                },
-            )
-
-            if dom_result.get("result", {}).get("value"):
-                dom_path.write_text(dom_result["result"]["value"])
-                artifacts["dom"] = str(dom_path)
-                if not args.quiet:
-                    print(f"DOM extracted to: {dom_path}", file=sys.stderr)
+            await save_dom(conn, dom_path)
+            artifacts["dom"] = str(dom_path)
+            logger.info("DOM extracted to: %s", dom_path)
 
         # Generate summary
         summary_data = {
@@ -166,52 +246,41 @@ async def orchestrate_handler_async(args: argparse.Namespace) -> int:
 
         if args.summary in ["json", "both"]:
             json_path = output_dir / f"summary-{session_id}.json"
-            json_path.write_text(json.dumps(summary_data, indent=2))
-            if not args.quiet:
-                print(f"JSON summary: {json_path}", file=sys.stderr)
+            # Compact; the file is for tools, the text summary is for people
+            json_path.write_text(json.dumps(summary_data, separators=(",", ":")))
+            logger.info("JSON summary: %s", json_path)
 
         if args.summary in ["text", "both"]:
             text_path = output_dir / f"summary-{session_id}.txt"
-            text_lines = [
-                f"Debugging Session Summary",
-                f"=" * 50,
-                f"URL: {args.url}",
-                f"Mode: {args.mode}",
-                f"Duration: {args.duration}s",
-                f"Timestamp: {timestamp}",
-                f"",
-                f"Artifacts:",
-            ]
-            for artifact_type, artifact_path in artifacts.items():
-                text_lines.append(f"  - {artifact_type}: {artifact_path}")
-
-            text_path.write_text("\n".join(text_lines))
-            if not args.quiet:
-                print(f"Text summary: {text_path}", file=sys.stderr)
+            text = _TEXT_SUMMARY.format(
+                url=args.url,
+                mode=args.mode,
+                duration=args.duration,
+                timestamp=timestamp,
+            ) + "".join(
+                f"\n  - {artifact_type}: {artifact_path}"
+                for artifact_type, artifact_path in artifacts.items()
+            )
+            text_path.write_text(text)
+            logger.info("Text summary: %s", text_path)
 
         return 0
 
     except CDPError as e:
-        if hasattr(args, "config") and args.config.log_level.upper() == "DEBUG":
-            raise
-        print(f"Error: {e}", file=sys.stderr)
-        if e.details.get("recovery"):
-            print(f"Recovery hint: {e.details['recovery']}", file=sys.stderr)
+        log_cdp_error(e)
         return 1
 
     except Exception as e:
-        if hasattr(args, "config") and args.config.log_level.upper() == "DEBUG":
-            raise
-        print(f"Unexpected error: {e}", file=sys.stderr)
+        # Full traceback only in debug mode
+        logger.error(
+            "Unexpected error: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG)
+        )
         return 1
 
     finally:
         # Cleanup: kill Chrome if we launched it
         if chrome_pid:
-            try:
-                subprocess.run(["kill", str(chrome_pid)], timeout=5)
-            except Exception:
-                pass  # Best effort cleanup
+            await _stop_chrome(chrome_pid)
 
 
 def orchestrate_handler(args: argparse.Namespace) -> int:
@@ -224,7 +293,7 @@ def orchestrate_handler(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    return asyncio.run(orchestrate_handler_async(args))
+    return run_async(orchestrate_handler_async(args))
 
 
 def register_subcommand(
@@ -242,26 +311,7 @@ def register_subcommand(
         parents=[parent],
         help="Run automated debugging workflow",
         description="Launch Chrome and run full debugging session with collectors",
-        epilog="""
-Examples:
-  # Headless session
-  browser-debugger orchestrate headless https://example.com
-
-  # Headed session (interactive)
-  browser-debugger orchestrate headed https://example.com
-
-  # Include console monitoring
-  browser-debugger orchestrate headless https://example.com --include-console
-
-  # Custom duration
-  browser-debugger orchestrate headless https://example.com --duration 60
-
-  # Text summary
-  browser-debugger orchestrate headless https://example.com --summary text
-
-  # JSON + text summaries
-  browser-debugger orchestrate headless https://example.com --summary both
-        """,
+        epilog=_ORCHESTRATE_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -308,4 +358,6 @@ Examples:
     )
 
     # Set handler function
-    orchestrate_parser.set_defaults(func=orchestrate_handler)
+    orchestrate_parser.set_defaults(
+        func=orchestrate_handler, func_async=orchestrate_handler_async
+    )
@@ -5,14 +5,56 @@ Implements 'query' command for direct CDP method invocation with custom params.
 """
 
 import argparse
-import asyncio
 import json
-import sys
+import logging
 
-from ..session import CDPSession
-from ..exceptions import CDPError, CDPTargetNotFoundError
+from .common import cdp_command, print_json, run_async, target_connection
 
+logger = logging.getLogger(__name__)
 
+# Examples shown by 'query --help'
+_QUERY_EPILOG = """
+Examples:
+  # Simple command
+  browser-debugger query --method Runtime.evaluate --params '{"expression":"document.title","returnByValue":true}'
+
+  # Command on specific target
+  browser-debugger query --target <target-id> --method Page.navigate --params '{"url":"https://example.com"}'
+
+  # Command on target matching URL
+  browser-debugger query --url example.com --method Runtime.getHeapUsage
+
+  # Enable domain
+  browser-debugger query --method Console.enable
+
+  # Complex params
+  browser-debugger query --method Emulation.setDeviceMetricsOverride --params '{"width":375,"height":667,"deviceScaleFactor":2,"mobile":true}'
+"""
+
+
+def _json_params(value: str) -> dict:
+    """
+    Decode --params while parsing arguments, before any connection is made.
+
+    Args:
+        value: Raw --params string
+
+    Returns:
+        Decoded params object
+
+    Raises:
+        argparse.ArgumentTypeError: If value is not a JSON object
+    """
+    try:
+        params = json.loads(value)
+    except json.JSONDecodeError as e:
+        raise argparse.ArgumentTypeError(f"invalid JSON: {e}") from e
+    if not isinstance(params, dict):
+        raise argparse.ArgumentTypeError("must be a JSON object")
+    return params
+
+
+@cdp_command
 async def query_handler_async(args: argparse.Namespace) -> int:
     """
     Handle 'query' command (async implementation).
@@ -25,76 +67,17 @@ async def query_handler_async(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    try:
-        # Parse params JSON
-        params = {}
-        if args.params:
-            try:
-                params = json.loads(args.params)
-            except json.JSONDecodeError as e:
-                print(f"Error: Invalid JSON params: {e}", file=sys.stderr)
-                return 1
-
-        # Create CDP session
-        session = CDPSession(
-            chrome_host=args.chrome_host,
-            chrome_port=args.chrome_port,
-            timeout=args.timeout,
-        )
-
-        # Find target
-        if args.target:
-            target = session.get_target_by_id(args.target)
-            if not target:
-                raise CDPTargetNotFoundError(
-                    f"Target not found: {args.target}",
-                    target_id=args.target,
-                )
-        elif args.url:
-            targets = session.list_targets(target_type="page", url_pattern=args.url)
-            if not targets:
-                raise CDPTargetNotFoundError(
-                    f"No page target matching URL: {args.url}",
-                    url_pattern=args.url,
-                )
-            target = targets[0]
-        else:
-            conn = await session.connect_to_first_page()
-            async with conn:
-                # Execute command
-                result = await conn.execute_command(args.method, params)
-
-                # Output result
-                if args.format == "json":
-                    print(json.dumps(result, indent=2))
-                else:
-                    # Pretty-print for text format
-                    print(json.dumps(result, indent=2))
-
-            return 0
-
-        # Connect to target
-        conn = await session.connect_to_target(target)
-        async with conn:
-            # Execute command
-            result = await conn.execute_command(args.method, params)
-
-            # Output result
-            if args.format == "json":
-                print(json.dumps(result, indent=2))
-            else:
-                # Pretty-print for text format
-                print(json.dumps(result, indent=2))
-
-        return 0
-
-    except CDPError as e:
-        if hasattr(args, "config") and args.config.log_level.upper() == "DEBUG":
-            raise
-        print(f"Error: {e}", file=sys.stderr)
-        if e.details.get("recovery"):
-            print(f"Recovery hint: {e.details['recovery']}", file=sys.stderr)
-        return 1
+    # --params was already decoded and checked by _json_params
+    params = args.params or {}
+
+    async with target_connection(args) as conn:
+        # Execute command
+        result = await conn.execute_command(args.method, params)
+
+        # Output result (pretty-printed JSON for both formats)
+        print_json(result)
+
+    return 0
 
 
 def query_handler(args: argparse.Namespace) -> int:
@@ -107,7 +90,7 @@ def query_handler(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
-    return asyncio.run(query_handler_async(args))
+    return run_async(query_handler_async(args))
 
 
 def register_subcommand(
@@ -125,23 +108,7 @@ def register_subcommand(
         parents=[parent],
         help="Execute arbitrary CDP command",
         description="Execute any CDP method with custom parameters",
-        epilog="""
-Examples:
-  # Simple command
-  browser-debugger query --method Runtime.evaluate --params '{"expression":"document.title","returnByValue":true}'
-
-  # Command on specific target
-  browser-debugger query --target <target-id> --method Page.navigate --params '{"url":"https://example.com"}'
-
-  # Command on target matching URL
-  browser-debugger query --url example.com --method Runtime.getHeapUsage
-
-  # Enable domain
-  browser-debugger query --method Console.enable
-
-  # Complex params
-  browser-debugger query --method Emulation.setDeviceMetricsOverride --params '{"width":375,"height":667,"deviceScaleFactor":2,"mobile":true}'
-        """,
+        epilog=_QUERY_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -163,8 +130,9 @@ Examples:
     # Parameters
     query_parser.add_argument(
         "--params",
+        type=_json_params,
         help="JSON-encoded parameters for the CDP method",
     )
 
     # Set handler function
-    query_parser.set_defaults(func=query_handler)
+    query_parser.set_defaults(func=query_handler, func_async=query_handler_async)
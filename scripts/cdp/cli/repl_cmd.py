@@ -0,0 +1,220 @@
+"""
+Repl subcommand for running several commands over one CDP connection.
+
+Implements 'repl' command: reads subcommand lines from stdin and runs them
+against a single WebSocket connection and event loop.
+"""
+
+import argparse
+import asyncio
+import logging
+import shlex
+import sys
+
+from .common import cdp_command, run_async, shared_connection, target_connection
+from .main import create_main_parser, create_parent_parser
+
+logger = logging.getLogger(__name__)
+
+# Lines that end the session besides EOF
+EXIT_COMMANDS = frozenset({"exit", "quit"})
+
+# Global options a command inherits from the repl invocation unless the
+# line sets them itself ("quiet" and "verbose" are one exclusive choice)
+INHERITED_OPTIONS = (
+    "chrome_host",
+    "chrome_port",
+    "timeout",
+    "format",
+    "log_level",
+    "quiet",
+    "verbose",
+)
+
+# Default of the inherited options on repl lines, so one a line sets to its
+# usual default is still told apart from one not given at all
+_UNSET = object()
+
+# Examples shown by 'repl --help'
+_REPL_EPILOG = """
+Examples:
+  # Interactive session against the first page
+  browser-debugger repl
+
+  # Scripted batch against a target matching URL
+  printf '%s\\n' 'eval "document.title"' 'dom dump --output dom.html' \\
+    | browser-debugger repl --url example.com
+
+Commands that pass their own --target/--url open a separate connection.
+Type 'exit' or 'quit' (or send EOF) to end the session.
+"""
+
+
+async def _read_line(prompt: str) -> str:
+    """
+    Read one line from stdin without blocking the event loop.
+
+    Args:
+        prompt: Prompt written to stderr first when stdin is a terminal
+
+    Returns:
+        The line including its newline, or "" at EOF
+    """
+    if prompt and sys.stdin.isatty():
+        print(prompt, end="", file=sys.stderr, flush=True)
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, sys.stdin.readline)
+
+
+def create_line_parser() -> argparse.ArgumentParser:
+    """
+    Create the parser for repl input lines.
+
+    Returns:
+        Main ArgumentParser whose global options default to _UNSET
+    """
+    parent = create_parent_parser()
+    parent.set_defaults(**dict.fromkeys(INHERITED_OPTIONS, _UNSET))
+    return create_main_parser(parent)
+
+
+async def _run_line(
+    parser: argparse.ArgumentParser,
+    line: str,
+    repl_args: argparse.Namespace,
+) -> int:
+    """
+    Parse one input line as a subcommand and run it.
+
+    Errors are reported like main() does, and end only this command, not
+    the session.
+
+    Args:
+        parser: Parser from create_line_parser()
+        line: Command line without the program name, e.g. 'eval "1 + 1"'
+        repl_args: Parsed arguments of the repl invocation
+
+    Returns:
+        The subcommand's exit code (2 for parse errors, 1 for other errors)
+    """
+    try:
+        args = parser.parse_args(shlex.split(line))
+    except ValueError as e:  # unbalanced quotes
+        logger.error("%s", e)
+        return 2
+    except SystemExit as e:  # argparse error or --help
+        return e.code if isinstance(e.code, int) else 2
+
+    if args.subcommand == "repl":
+        logger.error("repl cannot be nested")
+        return 2
+
+    # A line's --quiet or --verbose replaces the repl's choice of either
+    verbosity_set = args.quiet is not _UNSET or args.verbose is not _UNSET
+    for option in INHERITED_OPTIONS:
+        if getattr(args, option) is not _UNSET:
+            continue
+        if option in ("quiet", "verbose") and verbosity_set:
+            setattr(args, option, False)
+        else:
+            setattr(args, option, getattr(repl_args, option))
+    args.config = getattr(repl_args, "config", None)
+
+    try:
+        func_async = getattr(args, "func_async", None)
+        if func_async is not None:
+            return await func_async(args)
+
+        # Synchronous handlers (session list) do blocking HTTP only
+        return args.func(args)
+    except Exception as e:  # pylint: disable=broad-exception-caught
+        # Reported like main() does, but the session goes on
+        logger.error("%s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+        return 1
+
+
+@cdp_command
+async def repl_handler_async(args: argparse.Namespace) -> int:
+    """
+    Handle 'repl' command (async implementation).
+
+    Opens one connection to the target selected by --target/--url (or the
+    first page) and runs each stdin line as a subcommand. Commands without
+    their own --target/--url reuse that connection, so only the first pays
+    for target discovery and the WebSocket handshake.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code of the last command run (0 if none)
+    """
+    parser = create_line_parser()
+    exit_code = 0
+
+    async with target_connection(args) as conn:
+        token = shared_connection.set(conn)
+        try:
+            while True:
+                line = await _read_line("cdp> ")
+                if not line:
+                    break
+                line = line.strip()
+                if not line or line.startswith("#"):
+                    continue
+                if line in EXIT_COMMANDS:
+                    break
+
+                exit_code = await _run_line(parser, line, args)
+                sys.stdout.flush()
+        finally:
+            shared_connection.reset(token)
+
+    return exit_code
+
+
+def repl_handler(args: argparse.Namespace) -> int:
+    """
+    Synchronous wrapper for repl_handler_async.
+
+    Args:
+        args: Parsed command-line arguments
+
+    Returns:
+        Exit code (0 for success, non-zero for errors)
+    """
+    return run_async(repl_handler_async(args))
+
+
+def register_subcommand(
+    subparsers: argparse._SubParsersAction, parent: argparse.ArgumentParser
+) -> None:
+    """
+    Register 'repl' subcommand.
+
+    Args:
+        subparsers: Subparsers from main parser
+        parent: Parent parser with global options
+    """
+    repl_parser = subparsers.add_parser(
+        "repl",
+        parents=[parent],
+        help="Run several commands over one connection",
+        description=(
+            "Read subcommands from stdin, one per line, and run them over a "
+            "single CDP connection"
+        ),
+        epilog=_REPL_EPILOG,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    # Target selection (mutual exclusion)
+    target_group = repl_parser.add_mutually_exclusive_group()
+    target_group.add_argument("--target", help="Target ID to connect to")
+    target_group.add_argument(
+        "--url",
+        help="URL pattern to match target (uses first match)",
+    )
+
+    # Set handler function
+    repl_parser.set_defaults(func=repl_handler, func_async=repl_handler_async)
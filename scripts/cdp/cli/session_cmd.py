@@ -5,13 +5,31 @@ Implements 'session list' command to discover and filter Chrome targets.
 """
 
 import argparse
-import json
 import sys
 from typing import List
 
-from ..session import CDPSession
+from .common import log_cdp_error, print_json
 from ..exceptions import CDPError
 
+# Examples shown by 'session --help'
+_SESSION_EPILOG = """
+Examples:
+  # List all targets
+  browser-debugger session list
+
+  # List only page targets
+  browser-debugger session list --type page
+
+  # Find targets matching URL pattern
+  browser-debugger session list --url example.com
+
+  # Combine filters
+  browser-debugger session list --type page --url localhost
+
+  # Output as table
+  browser-debugger session list --format table
+"""
+
 
 def session_list_handler(args: argparse.Namespace) -> int:
     """
@@ -25,6 +43,10 @@ def session_list_handler(args: argparse.Namespace) -> int:
     Returns:
         Exit code (0 for success, non-zero for errors)
     """
+    # Deferred so registering the subcommand stays cheap
+    # pylint: disable=import-outside-toplevel
+    from ..session import CDPSession, Target
+
     try:
         # Create CDP session
         session = CDPSession(
@@ -35,34 +57,41 @@ def session_list_handler(args: argparse.Namespace) -> int:
 
         # List targets with filters
         targets = session.list_targets(
-            target_type=args.type if hasattr(args, "type") else None,
-            url_pattern=args.url if hasattr(args, "url") else None,
+            target_type=args.type,
+            url_pattern=args.url,
         )
 
         # Output results
         if args.format == "json":
-            output = [target.to_dict() for target in targets]
-            print(json.dumps(output, indent=2))
+            # Targets are converted one at a time as the encoder reaches them
+            print_json(targets, default=Target.to_dict)
         elif args.format == "text":
-            for target in targets:
-                print(f"{target.id}\t{target.type}\t{target.url}\t{target.title}")
+            # One write for all rows instead of a print() per target
+            sys.stdout.write(
+                "".join(
+                    f"{target.id}\t{target.type}\t{target.url}\t{target.title}\n"
+                    for target in targets
+                )
+            )
         elif args.format == "table":
             # Simple table format
-            print(f"{'ID':<40} {'TYPE':<15} {'URL':<50} {'TITLE':<30}")
-            print("-" * 135)
-            for target in targets:
-                print(
-                    f"{target.id:<40} {target.type:<15} {target.url[:50]:<50} {target.title[:30]:<30}"
+            sys.stdout.write(
+                "".join(
+                    [
+                        f"{'ID':<40} {'TYPE':<15} {'URL':<50} {'TITLE':<30}\n",
+                        "-" * 135 + "\n",
+                    ]
+                    + [
+                        f"{target.id:<40} {target.type:<15} {target.url[:50]:<50} {target.title[:30]:<30}\n"
+                        for target in targets
+                    ]
                 )
+            )
 
         return 0
 
     except CDPError as e:
-        if hasattr(args, "config") and args.config.log_level.upper() == "DEBUG":
-            raise
-        print(f"Error: {e}", file=sys.stderr)
-        if e.details.get("recovery"):
-            print(f"Recovery hint: {e.details['recovery']}", file=sys.stderr)
+        log_cdp_error(e)
         return 1
 
 
@@ -82,23 +111,7 @@ def register_subcommand(
         parents=[parent],
         help="List and inspect Chrome targets",
         description="Discover and filter Chrome targets via CDP HTTP endpoint",
-        epilog="""
-Examples:
-  # List all targets
-  browser-debugger session list
-
-  # List only page targets
-  browser-debugger session list --type page
-
-  # Find targets matching URL pattern
-  browser-debugger session list --url example.com
-
-  # Combine filters
-  browser-debugger session list --type page --url localhost
-
-  # Output as table
-  browser-debugger session list --format table
-        """,
+        epilog=_SESSION_EPILOG,
         formatter_class=argparse.RawDescriptionHelpFormatter,
     )
 
@@ -6,14 +6,22 @@ Implements User Story 2: Ergonomic Collector Refactoring
 
 import asyncio
 import json
+import os
 import sys
 from pathlib import Path
+from types import ModuleType
 from collections import deque
-from typing import Optional, Callable, Awaitable, TextIO, Deque, TypedDict
+from typing import Optional, Callable, Awaitable, BinaryIO, TextIO, Deque, Iterable, TypedDict
 
 from ..connection import CDPConnection
 from ..exceptions import CDPError
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
 
 class ConsoleEntry(TypedDict):
     """Structure of a console log entry."""
@@ -24,6 +32,32 @@ class ConsoleEntry(TypedDict):
     line: int
 
 
+def _encode_line(entry: ConsoleEntry) -> bytes:
+    """Serialize a console entry as one UTF-8 JSONL line."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry) + "\n").encode("utf-8")
+
+
+# Buffered entries are flushed to output_path every FLUSH_INTERVAL seconds,
+# or as soon as FLUSH_HIGH_WATER are pending so bursts are not dropped by
+# the bounded buffer
+FLUSH_INTERVAL = 30
+FLUSH_HIGH_WATER = 256
+
+# Stdout streaming batches lines until this many bytes are pending or the
+# delay (seconds) after the first pending line has passed
+STDOUT_FLUSH_BYTES = 64 * 1024
+STDOUT_FLUSH_DELAY = 0.05
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write encoded lines to stdout and flush them immediately."""
+    sys.stdout.flush()  # keep ordering with any earlier print()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
 class ConsoleCollector:
     """
     Captures console messages (log, warn, error, debug, info) from the page.
@@ -45,12 +79,26 @@ class ConsoleCollector:
                 await asyncio.sleep(10)  # Monitor for 10 seconds
             # Messages streamed to stdout in real-time
 
+        # Write through to an already open binary file
+        async with CDPConnection(ws_url) as conn:
+            with open("/tmp/console-logs.jsonl", "ab") as f:
+                async with ConsoleCollector(conn, output_file=f) as collector:
+                    await asyncio.sleep(10)
+
     Attributes:
         connection: Active CDP connection
         output_path: Output file path for captured data (None = stream to stdout)
+        output_file: Open binary file each entry is written to as it arrives
         level_filter: Minimum log level to capture ("log", "info", "warn", "error")
-        _buffer: Bounded in-memory buffer (max 1000 entries, only used for file output)
+        max_entries: Stop capturing after this many entries (None = no limit)
+        done: Event set once max_entries is reached; callers may also set it
+            to end wait() early (e.g. when the target detaches)
+        _buffer: Bounded buffer of encoded JSONL lines (max 1000, only used for file output)
         _flush_task: Background task for periodic flush (file mode only)
+        _flush_due: Set when the buffer reaches FLUSH_HIGH_WATER entries
+        _fd: Append-mode descriptor for output_path, kept open between flushes
+        _write_future: Latest buffer write handed to the thread executor
+        _stdout_buf: Encoded lines not yet written to stdout (stream mode only)
         _running: Flag indicating if collector is active
     """
 
@@ -70,6 +118,8 @@ class ConsoleCollector:
         connection: CDPConnection,
         output_path: Optional[Path] = None,
         level_filter: Optional[str] = None,
+        output_file: Optional[BinaryIO] = None,
+        max_entries: Optional[int] = None,
     ):
         """
         Initialize console collector.
@@ -78,15 +128,32 @@ class ConsoleCollector:
             connection: Active CDPConnection instance
             output_path: Output file path for JSONL logs (None = stream to stdout)
             level_filter: Minimum log level to capture (None = capture all)
+            output_file: Already open binary file to write JSONL to as entries
+                arrive, bypassing the buffer. The caller owns and closes it.
+            max_entries: Number of captured entries after which done is set
+                and further messages are ignored (None = no limit)
         """
         self.connection = connection
         self.output_path = Path(output_path) if output_path else None
+        self.output_file = output_file
         self.level_filter = level_filter
-
-        self._buffer: Deque[ConsoleEntry] = deque(
+        # Resolved once; the filter is checked for every message
+        self._filter_idx = (
+            self.LOG_LEVELS.get(level_filter.lower(), 0) if level_filter else None
+        )
+        self.max_entries = max_entries
+        self.done = asyncio.Event()
+        self._captured = 0
+
+        self._buffer: Deque[bytes] = deque(
             maxlen=1000
         )  # Bounded buffer (FR-012: memory leak prevention)
         self._flush_task: Optional[asyncio.Task] = None
+        self._flush_due = asyncio.Event()
+        self._fd: Optional[int] = None
+        self._write_future: Optional[asyncio.Future] = None
+        self._stdout_buf = bytearray()
+        self._stdout_flush_handle: Optional[asyncio.TimerHandle] = None
         self._running = False
 
     async def start(self):
@@ -107,18 +174,24 @@ class ConsoleCollector:
 
         self._running = True
 
-        # Start periodic flush if output path specified
-        if self.output_path:
+        # Start periodic flush if entries are buffered for output_path
+        if self.output_path and self.output_file is None:
+            self._open_output()
             self._flush_task = asyncio.create_task(self._periodic_flush())
 
     async def stop(self):
         """
         Stop monitoring and flush data.
 
-        Cancels periodic flush task, performs final flush, and unsubscribes from events.
+        Unsubscribes from events first, so no message lands in the buffer after
+        its final snapshot, then cancels periodic flush task and performs final
+        flush.
         """
         self._running = False
 
+        # Unsubscribe from events
+        self.connection.unsubscribe("Console.messageAdded", self._on_message)
+
         # Cancel periodic flush task
         if self._flush_task:
             self._flush_task.cancel()
@@ -127,95 +200,173 @@ class ConsoleCollector:
             except asyncio.CancelledError:
                 pass  # Expected
 
-        # Final flush to disk
-        if self.output_path:
-            self._flush_to_disk()
+        # Let a write already handed to the executor land first
+        if self._write_future is not None:
+            await self._write_future
 
-        # Unsubscribe from events
-        self.connection.unsubscribe("Console.messageAdded", self._on_message)
+        # Final flush to disk
+        if self.output_file is not None:
+            self.output_file.flush()
+        elif self.output_path:
+            await self._flush_to_disk_async()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        else:
+            self._flush_stdout()
 
-    async def _on_message(self, params: dict):
+    def _on_message(self, params: dict):
         """
         Event handler for Console.messageAdded.
 
         Applies level filtering and either streams to stdout or appends to buffer.
-        Non-blocking to avoid stalling CDP receive loop (see Principle 3: Token Efficiency).
+        Synchronous, so the connection calls it inline instead of creating a
+        task per message; it must not block the CDP receive loop.
 
         Args:
             params: CDP event parameters containing message object
         """
         message = params.get("message", {})
+        level = message.get("level", "log")
 
-        # Apply level filter
-        if self.level_filter and not self._should_capture(message.get("level", "log")):
+        # Apply level filter (CDP levels are lowercase; unknown ones rank lowest)
+        if self._filter_idx is not None and self.LOG_LEVELS.get(level, 0) < self._filter_idx:
             return
 
+        if self.max_entries is not None:
+            if self._captured >= self.max_entries:
+                return
+            self._captured += 1
+            if self._captured >= self.max_entries:
+                self.done.set()
+
         entry: ConsoleEntry = {
             "timestamp": float(message.get("timestamp", 0)),
-            "level": str(message.get("level", "log")),
+            "level": str(level),
             "text": str(message.get("text", "")),
             "url": str(message.get("url", "")),
             "line": int(message.get("lineNumber", 0)),
         }
 
-        # Stream to stdout if no output path specified, otherwise buffer for file
-        if self.output_path is None:
-            # Real-time stdout streaming
-            print(json.dumps(entry), file=sys.stdout, flush=True)
+        # Write through to an open file, stream to stdout if no output path
+        # specified, otherwise buffer for file
+        if self.output_file is not None:
+            # Memory stays flat however long the stream runs; the file's
+            # own buffer batches the actual writes
+            self.output_file.write(_encode_line(entry))
+        elif self.output_path is None:
+            # Real-time stdout streaming, batched per STDOUT_FLUSH_DELAY
+            self._stream_stdout(_encode_line(entry))
         else:
-            # Append to bounded buffer (oldest entries automatically dropped if full)
-            self._buffer.append(entry)
+            # Append to bounded buffer (oldest entries automatically dropped
+            # if full), encoded now so flushes only join bytes
+            self._buffer.append(_encode_line(entry))
+            if len(self._buffer) >= FLUSH_HIGH_WATER:
+                self._flush_due.set()
 
-    def _should_capture(self, level: str) -> bool:
+    async def wait(self, timeout: float) -> bool:
         """
-        Check if log level should be captured based on level_filter.
+        Wait until done is set or the timeout elapses.
 
         Args:
-            level: Log level from CDP message
+            timeout: Maximum time to wait in seconds
 
         Returns:
-            True if level >= level_filter, False otherwise
+            True if done was set, False if the full timeout elapsed
+        """
+        try:
+            await asyncio.wait_for(self.done.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return False  # Ran for the full duration
+        return True
+
+    def _stream_stdout(self, line: bytes):
         """
-        if not self.level_filter:
-            return True  # Capture all if no filter
+        Queue an encoded line for stdout.
 
-        # Get level indices (default to 0 if unknown)
-        filter_idx = self.LOG_LEVELS.get(self.level_filter.lower(), 0)
-        level_idx = self.LOG_LEVELS.get(level.lower(), 0)
+        Lines go out together once STDOUT_FLUSH_BYTES are pending or
+        STDOUT_FLUSH_DELAY has passed, so a burst of events costs one write
+        and flush instead of one per event.
 
-        return level_idx >= filter_idx
+        Args:
+            line: Encoded JSONL line
+        """
+        self._stdout_buf += line
+        if len(self._stdout_buf) >= STDOUT_FLUSH_BYTES:
+            self._flush_stdout()
+        elif self._stdout_flush_handle is None:
+            self._stdout_flush_handle = asyncio.get_running_loop().call_later(
+                STDOUT_FLUSH_DELAY, self._flush_stdout
+            )
+
+    def _flush_stdout(self):
+        """Write and flush the lines queued by _stream_stdout."""
+        if self._stdout_flush_handle is not None:
+            self._stdout_flush_handle.cancel()
+            self._stdout_flush_handle = None
+        if self._stdout_buf:
+            data, self._stdout_buf = self._stdout_buf, bytearray()
+            _write_stdout(data)
 
     async def _periodic_flush(self):
         """
-        Flush buffer to disk every 30 seconds.
+        Flush buffer to disk every FLUSH_INTERVAL seconds, or early once
+        FLUSH_HIGH_WATER entries are pending.
 
         Runs in background task until cancelled. Prevents unbounded memory growth
         during long sessions (FR-012: memory leak prevention).
         """
         while self._running:
-            await asyncio.sleep(30)
-            self._flush_to_disk()
+            try:
+                await asyncio.wait_for(self._flush_due.wait(), FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass  # Regular interval flush
+            self._flush_due.clear()
+            await self._flush_to_disk_async()
 
-    def _flush_to_disk(self):
+    async def _flush_to_disk_async(self):
         """
-        Write buffer to JSONL file.
+        Write buffer to JSONL file from a worker thread.
 
-        Appends entries to output_path in JSONL format (one JSON object per line).
-        Clears buffer after writing to free memory.
+        Takes the buffered entries on the event loop, then encodes and writes
+        them in the default executor so the receive loop keeps dispatching
+        events meanwhile. The write is shielded: if the caller is cancelled
+        (stop() cancelling the periodic flush) it still completes, and stop()
+        waits for it before the final flush.
         """
         if not self.output_path or not self._buffer:
             return
 
-        # Ensure parent directory exists
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        entries = list(self._buffer)
+        self._buffer.clear()
 
-        # Append to JSONL file
-        with open(self.output_path, "a") as f:
-            for entry in self._buffer:
-                f.write(json.dumps(entry) + "\n")
+        loop = asyncio.get_running_loop()
+        self._write_future = loop.run_in_executor(None, self._write_entries, entries)
+        await asyncio.shield(self._write_future)
 
-        # Clear buffer to free memory
-        self._buffer.clear()
+    def _write_entries(self, entries: Iterable[bytes]):
+        """
+        Append entries to output_path as JSONL.
+
+        Args:
+            entries: Encoded JSONL lines to write, oldest first
+        """
+        if self._fd is None:
+            self._open_output()
+        assert self._fd is not None  # opened above or by start()
+
+        # One append per flush; a short write (e.g. interrupted by a signal)
+        # continues where it stopped
+        payload = memoryview(b"".join(entries))
+        while payload:
+            payload = payload[os.write(self._fd, payload):]
+
+    def _open_output(self):
+        """Create output_path's directory and open it for appending once."""
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(
+            self.output_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
 
     async def __aenter__(self):
         """Context manager entry: start collector."""
@@ -6,10 +6,14 @@ Implements User Story 4: Core Command Implementation - Network Monitoring
 
 import asyncio
 import json
+import os
 import sys
 from pathlib import Path
-from collections import deque
-from typing import Optional, Dict, Deque, TypedDict, TYPE_CHECKING
+from types import ModuleType
+from collections import OrderedDict, deque
+from typing import (
+    Optional, BinaryIO, Deque, Iterable, NamedTuple, Set, TypedDict, TYPE_CHECKING
+)
 
 # NotRequired added in Python 3.11, use typing_extensions for 3.10 compatibility
 if TYPE_CHECKING:
@@ -25,16 +29,36 @@ else:
 from ..connection import CDPConnection
 from ..exceptions import CDPError
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
 
-class RequestData(TypedDict):
-    """Structure of stored request data for matching with responses."""
-    requestId: str
+
+# Requests tracked while waiting for their response; the oldest are
+# dropped first on pages that never finish loading them
+MAX_TRACKED_REQUESTS = 10_000
+
+# Network.getResponseBody calls allowed in flight at once
+MAX_BODY_FETCHES = 16
+
+# Binary MIME types whose bodies are not captured
+_SKIP_BODY_MIME_PREFIXES = ("image/", "video/", "audio/", "font/")
+
+
+class RequestData(NamedTuple):
+    """Stored request data for matching with responses (keyed by requestId)."""
     url: str
     method: str
     timestamp: float
     type: str
 
 
+# Stand-in for requests that were never seen (or already evicted)
+_UNKNOWN_REQUEST = RequestData(url="", method="GET", timestamp=0.0, type="")
+
+
 class NetworkEntry(TypedDict):
     """Structure of a network event entry."""
     requestId: Optional[str]
@@ -50,6 +74,32 @@ class NetworkEntry(TypedDict):
     errorText: NotRequired[str]  # Optional: only present in failed requests
 
 
+def _encode_line(entry: NetworkEntry) -> bytes:
+    """Serialize a network entry as one UTF-8 JSONL line."""
+    if orjson is not None:
+        return orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    return (json.dumps(entry) + "\n").encode("utf-8")
+
+
+# Buffered entries are flushed to output_path every FLUSH_INTERVAL seconds,
+# or as soon as FLUSH_HIGH_WATER are pending so bursts are not dropped by
+# the bounded buffer
+FLUSH_INTERVAL = 30
+FLUSH_HIGH_WATER = 256
+
+# Stdout streaming batches lines until this many bytes are pending or the
+# delay (seconds) after the first pending line has passed
+STDOUT_FLUSH_BYTES = 64 * 1024
+STDOUT_FLUSH_DELAY = 0.05
+
+
+def _write_stdout(data: bytes) -> None:
+    """Write encoded lines to stdout and flush them immediately."""
+    sys.stdout.flush()  # keep ordering with any earlier print()
+    sys.stdout.buffer.write(data)
+    sys.stdout.buffer.flush()
+
+
 class NetworkCollector:
     """
     Captures network requests and responses from the page.
@@ -71,14 +121,26 @@ class NetworkCollector:
                 await asyncio.sleep(60)  # Monitor for 60 seconds
             # Network events streamed to stdout in real-time
 
+        # Write through to an already open binary file
+        async with CDPConnection(ws_url) as conn:
+            with open("/tmp/network-logs.jsonl", "ab") as f:
+                async with NetworkCollector(conn, output_file=f) as collector:
+                    await asyncio.sleep(60)
+
     Attributes:
         connection: Active CDP connection
         output_path: Output file path for captured data (None = stream to stdout)
+        output_file: Open binary file each entry is written to as it arrives
         include_bodies: Whether to capture response bodies
-        _buffer: Bounded in-memory buffer (max 1000 entries, only used for file output)
+        _buffer: Bounded buffer of encoded JSONL lines (max 1000, only used for file output)
         _flush_task: Background task for periodic flush (file mode only)
+        _flush_due: Set when the buffer reaches FLUSH_HIGH_WATER entries
+        _fd: Append-mode descriptor for output_path, kept open between flushes
+        _write_future: Latest buffer write handed to the thread executor
+        _stdout_buf: Encoded lines not yet written to stdout (stream mode only)
         _running: Flag indicating if collector is active
-        _requests: Dict mapping requestId to request data
+        _requests: Bounded LRU mapping requestId to request data
+        _body_tasks: Response body fetches still in flight
     """
 
     def __init__(
@@ -87,6 +149,7 @@ class NetworkCollector:
         output_path: Optional[Path] = None,
         include_bodies: bool = False,
         max_body_size: int = 1048576,  # 1MB default limit
+        output_file: Optional[BinaryIO] = None,
     ):
         """
         Initialize network collector.
@@ -96,16 +159,26 @@ class NetworkCollector:
             output_path: Output file path for JSONL logs (None = stream to stdout)
             include_bodies: Whether to capture response bodies
             max_body_size: Maximum response body size to capture (bytes)
+            output_file: Already open binary file to write JSONL to as entries
+                arrive, bypassing the buffer. The caller owns and closes it.
         """
         self.connection = connection
         self.output_path = Path(output_path) if output_path else None
+        self.output_file = output_file
         self.include_bodies = include_bodies
         self.max_body_size = max_body_size
 
-        self._buffer: Deque[NetworkEntry] = deque(maxlen=1000)  # Bounded buffer for memory leak prevention
+        self._buffer: Deque[bytes] = deque(maxlen=1000)  # Bounded buffer for memory leak prevention
         self._flush_task: Optional[asyncio.Task] = None
+        self._flush_due = asyncio.Event()
+        self._fd: Optional[int] = None
+        self._write_future: Optional[asyncio.Future] = None
+        self._stdout_buf = bytearray()
+        self._stdout_flush_handle: Optional[asyncio.TimerHandle] = None
         self._running = False
-        self._requests: Dict[str, RequestData] = {}  # Track requests for matching
+        self._requests: OrderedDict[str, RequestData] = OrderedDict()  # Track requests for matching
+        self._body_tasks: Set[asyncio.Task] = set()
+        self._body_slots = asyncio.Semaphore(MAX_BODY_FETCHES)
 
     async def start(self):
         """
@@ -128,18 +201,29 @@ class NetworkCollector:
 
         self._running = True
 
-        # Start periodic flush if output path specified
-        if self.output_path:
+        # Start periodic flush if entries are buffered for output_path
+        if self.output_path and self.output_file is None:
+            self._open_output()
             self._flush_task = asyncio.create_task(self._periodic_flush())
 
     async def stop(self):
         """
         Stop monitoring and flush data.
 
-        Cancels periodic flush task, performs final flush, and unsubscribes from events.
+        Unsubscribes from events first, so nothing new is captured while the
+        awaits below run, then cancels periodic flush task, waits for body
+        fetches and performs final flush.
         """
         self._running = False
 
+        # Unsubscribe from events
+        self.connection.unsubscribe("Network.requestWillBeSent", self._on_request)
+        self.connection.unsubscribe("Network.responseReceived", self._on_response)
+        self.connection.unsubscribe(
+            "Network.loadingFinished", self._on_loading_finished
+        )
+        self.connection.unsubscribe("Network.loadingFailed", self._on_loading_failed)
+
         # Cancel periodic flush task
         if self._flush_task:
             self._flush_task.cancel()
@@ -148,19 +232,27 @@ class NetworkCollector:
             except asyncio.CancelledError:
                 pass  # Expected
 
-        # Final flush to disk
-        if self.output_path:
-            self._flush_to_disk()
+        # Entries still waiting on their response body go out before the
+        # final flush
+        while self._body_tasks:
+            await asyncio.gather(*self._body_tasks, return_exceptions=True)
 
-        # Unsubscribe from events
-        self.connection.unsubscribe("Network.requestWillBeSent", self._on_request)
-        self.connection.unsubscribe("Network.responseReceived", self._on_response)
-        self.connection.unsubscribe(
-            "Network.loadingFinished", self._on_loading_finished
-        )
-        self.connection.unsubscribe("Network.loadingFailed", self._on_loading_failed)
+        # Let a write already handed to the executor land first
+        if self._write_future is not None:
+            await self._write_future
 
-    async def _on_request(self, params: dict):
+        # Final flush to disk
+        if self.output_file is not None:
+            self.output_file.flush()
+        elif self.output_path:
+            await self._flush_to_disk_async()
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+        else:
+            self._flush_stdout()
+
+    def _on_request(self, params: dict):
         """
         Event handler for Network.requestWillBeSent.
 
@@ -174,19 +266,24 @@ class NetworkCollector:
 
         # Store request for matching (only if we have a valid request_id)
         if request_id is not None:
-            self._requests[request_id] = {
-                "requestId": request_id,
-                "url": request.get("url", ""),
-                "method": request.get("method", ""),
-                "timestamp": params.get("timestamp", 0),
-                "type": params.get("type", ""),
-            }
-
-    async def _on_response(self, params: dict):
+            requests = self._requests
+            requests[request_id] = RequestData(
+                url=request.get("url", ""),
+                method=request.get("method", ""),
+                timestamp=params.get("timestamp", 0),
+                type=params.get("type", ""),
+            )
+            requests.move_to_end(request_id)  # redirects reuse the requestId
+            if len(requests) > MAX_TRACKED_REQUESTS:
+                requests.popitem(last=False)
+
+    def _on_response(self, params: dict):
         """
         Event handler for Network.responseReceived.
 
-        Matches response with request and optionally fetches body.
+        Matches response with request and optionally fetches body. The entry
+        is built right away, while the request is still tracked; a body fetch
+        runs as a background task so responses keep flowing meanwhile.
 
         Args:
             params: CDP event parameters containing response object
@@ -195,51 +292,60 @@ class NetworkCollector:
         response = params.get("response", {})
 
         # Get matching request (use default if not found)
-        default_request: RequestData = {
-            "requestId": "", "url": "", "method": "GET", "timestamp": 0.0, "type": ""
-        }
-        request_data: RequestData = (
-            self._requests.get(request_id, default_request) if request_id is not None else default_request
+        request_data = (
+            self._requests.get(request_id, _UNKNOWN_REQUEST)
+            if request_id is not None
+            else _UNKNOWN_REQUEST
         )
 
         # Build entry
         entry: NetworkEntry = {
             "requestId": request_id,
-            "url": str(response.get("url", request_data.get("url", ""))),
-            "method": str(request_data.get("method", "GET")),
+            "url": str(response.get("url", request_data.url)),
+            "method": str(request_data.method),
             "status": int(response.get("status", 0)),
             "statusText": str(response.get("statusText", "")),
             "mimeType": str(response.get("mimeType", "")),
             "timestamp": float(response.get("timing", {}).get("receiveHeadersEnd", 0)),
-            "type": str(params.get("type", request_data.get("type", ""))),
+            "type": str(params.get("type", request_data.type)),
         }
 
         # Capture response body if requested
         if self.include_bodies and self._should_capture_body(response):
-            try:
-                # Fetch response body via CDP
-                body_result = await self.connection.execute_command(
-                    "Network.getResponseBody", {"requestId": request_id}
-                )
-                if body_result.get("body"):
-                    body = body_result["body"]
-                    # Limit body size
-                    if len(body) <= self.max_body_size:
-                        entry["body"] = body
-                        entry["base64Encoded"] = body_result.get("base64Encoded", False)
-            except Exception:
-                # Body not available (e.g., redirect, cached, etc.)
-                pass
-
-        # Stream to stdout if no output path specified, otherwise buffer for file
-        if self.output_path is None:
-            # Real-time stdout streaming
-            print(json.dumps(entry), file=sys.stdout, flush=True)
+            task = asyncio.create_task(self._emit_with_body(entry))
+            self._body_tasks.add(task)
+            task.add_done_callback(self._body_tasks.discard)
         else:
-            # Append to buffer
-            self._buffer.append(entry)
+            self._emit(entry)
+
+    async def _emit_with_body(self, entry: NetworkEntry):
+        """
+        Fetch the response body for entry, then emit it.
 
-    async def _on_loading_finished(self, params: dict):
+        At most MAX_BODY_FETCHES fetches are in flight; the rest wait here.
+
+        Args:
+            entry: Response entry built by _on_response
+        """
+        try:
+            # Fetch response body via CDP
+            async with self._body_slots:
+                body_result = await self.connection.execute_command(
+                    "Network.getResponseBody", {"requestId": entry["requestId"]}
+                )
+            if body_result.get("body"):
+                body = body_result["body"]
+                # Limit body size
+                if len(body) <= self.max_body_size:
+                    entry["body"] = body
+                    entry["base64Encoded"] = body_result.get("base64Encoded", False)
+        except Exception:
+            # Body not available (e.g., redirect, cached, etc.)
+            pass
+
+        self._emit(entry)
+
+    def _on_loading_finished(self, params: dict):
         """
         Event handler for Network.loadingFinished.
 
@@ -253,7 +359,7 @@ class NetworkCollector:
         if request_id is not None:
             self._requests.pop(request_id, None)
 
-    async def _on_loading_failed(self, params: dict):
+    def _on_loading_failed(self, params: dict):
         """
         Event handler for Network.loadingFailed.
 
@@ -263,35 +369,48 @@ class NetworkCollector:
             params: CDP event parameters
         """
         request_id = params.get("requestId")
-        default_request: RequestData = {
-            "requestId": "", "url": "", "method": "GET", "timestamp": 0.0, "type": ""
-        }
-        request_data: RequestData = (
-            self._requests.get(request_id, default_request) if request_id is not None else default_request
+        request_data = (
+            self._requests.get(request_id, _UNKNOWN_REQUEST)
+            if request_id is not None
+            else _UNKNOWN_REQUEST
         )
 
         # Log failure
         entry: NetworkEntry = {
             "requestId": request_id,
-            "url": str(request_data.get("url", "")),
-            "method": str(request_data.get("method", "GET")),
+            "url": str(request_data.url),
+            "method": str(request_data.method),
             "status": 0,
             "statusText": "FAILED",
             "errorText": str(params.get("errorText", "")),
             "timestamp": float(params.get("timestamp", 0)),
         }
-
-        # Stream to stdout if no output path specified, otherwise buffer for file
-        if self.output_path is None:
-            # Real-time stdout streaming
-            print(json.dumps(entry), file=sys.stdout, flush=True)
-        else:
-            self._buffer.append(entry)
+        self._emit(entry)
 
         # Cleanup
         if request_id is not None:
             self._requests.pop(request_id, None)
 
+    def _emit(self, entry: NetworkEntry):
+        """
+        Output one entry.
+
+        Args:
+            entry: Entry to write
+        """
+        # Write through to an open file, stream to stdout if no output path
+        # specified, otherwise buffer for file
+        if self.output_file is not None:
+            self.output_file.write(_encode_line(entry))
+        elif self.output_path is None:
+            # Real-time stdout streaming, batched per STDOUT_FLUSH_DELAY
+            self._stream_stdout(_encode_line(entry))
+        else:
+            # Encoded now so flushes only join bytes
+            self._buffer.append(_encode_line(entry))
+            if len(self._buffer) >= FLUSH_HIGH_WATER:
+                self._flush_due.set()
+
     def _should_capture_body(self, response: dict) -> bool:
         """
         Determine if response body should be captured.
@@ -304,48 +423,109 @@ class NetworkCollector:
         """
         # Skip large files
         headers = response.get("headers", {})
-        content_length = headers.get("Content-Length", headers.get("content-length"))
-        if content_length and int(content_length) > self.max_body_size:
+        # HTTP/2 header names arrive lowercase, HTTP/1.1 ones as sent
+        content_length = headers.get("content-length") or headers.get("Content-Length")
+        if (
+            isinstance(content_length, str)
+            and content_length.isdigit()  # malformed values are ignored
+            and int(content_length) > self.max_body_size
+        ):
             return False
 
         # Skip binary types by default
         mime_type = response.get("mimeType", "").lower()
-        if mime_type.startswith(("image/", "video/", "audio/", "font/")):
+        if mime_type.startswith(_SKIP_BODY_MIME_PREFIXES):
             return False
 
         return True
 
+    def _stream_stdout(self, line: bytes):
+        """
+        Queue an encoded line for stdout.
+
+        Lines go out together once STDOUT_FLUSH_BYTES are pending or
+        STDOUT_FLUSH_DELAY has passed, so a burst of events costs one write
+        and flush instead of one per event.
+
+        Args:
+            line: Encoded JSONL line
+        """
+        self._stdout_buf += line
+        if len(self._stdout_buf) >= STDOUT_FLUSH_BYTES:
+            self._flush_stdout()
+        elif self._stdout_flush_handle is None:
+            self._stdout_flush_handle = asyncio.get_running_loop().call_later(
+                STDOUT_FLUSH_DELAY, self._flush_stdout
+            )
+
+    def _flush_stdout(self):
+        """Write and flush the lines queued by _stream_stdout."""
+        if self._stdout_flush_handle is not None:
+            self._stdout_flush_handle.cancel()
+            self._stdout_flush_handle = None
+        if self._stdout_buf:
+            data, self._stdout_buf = self._stdout_buf, bytearray()
+            _write_stdout(data)
+
     async def _periodic_flush(self):
         """
-        Flush buffer to disk every 30 seconds.
+        Flush buffer to disk every FLUSH_INTERVAL seconds, or early once
+        FLUSH_HIGH_WATER entries are pending.
 
         Runs in background task until cancelled. Prevents unbounded memory growth
         during long sessions.
         """
         while self._running:
-            await asyncio.sleep(30)
-            self._flush_to_disk()
+            try:
+                await asyncio.wait_for(self._flush_due.wait(), FLUSH_INTERVAL)
+            except asyncio.TimeoutError:
+                pass  # Regular interval flush
+            self._flush_due.clear()
+            await self._flush_to_disk_async()
 
-    def _flush_to_disk(self):
+    async def _flush_to_disk_async(self):
         """
-        Write buffer to JSONL file.
+        Write buffer to JSONL file from a worker thread.
 
-        Appends entries to output_path in JSONL format (one JSON object per line).
-        Clears buffer after writing to free memory.
+        Takes the buffered entries on the event loop, then encodes and writes
+        them in the default executor so the receive loop keeps dispatching
+        events meanwhile. The write is shielded: if the caller is cancelled
+        (stop() cancelling the periodic flush) it still completes, and stop()
+        waits for it before the final flush.
         """
         if not self.output_path or not self._buffer:
             return
 
-        # Ensure parent directory exists
-        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        entries = list(self._buffer)
+        self._buffer.clear()
 
-        # Append to JSONL file
-        with open(self.output_path, "a") as f:
-            for entry in self._buffer:
-                f.write(json.dumps(entry) + "\n")
+        loop = asyncio.get_running_loop()
+        self._write_future = loop.run_in_executor(None, self._write_entries, entries)
+        await asyncio.shield(self._write_future)
 
-        # Clear buffer to free memory
-        self._buffer.clear()
+    def _write_entries(self, entries: Iterable[bytes]):
+        """
+        Append entries to output_path as JSONL.
+
+        Args:
+            entries: Encoded JSONL lines to write, oldest first
+        """
+        if self._fd is None:
+            self._open_output()
+        assert self._fd is not None  # opened above or by start()
+
+        # One append per flush; a short write (e.g. interrupted by a signal)
+        # continues where it stopped
+        payload = memoryview(b"".join(entries))
+        while payload:
+            payload = payload[os.write(self._fd, payload):]
+
+    def _open_output(self):
+        """Create output_path's directory and open it for appending once."""
+        self.output_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fd = os.open(
+            self.output_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644
+        )
 
     async def __aenter__(self):
         """Context manager entry: start collector."""
@@ -15,8 +15,8 @@ Usage:
 import os
 import json
 import logging
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Any
 
 logger = logging.getLogger(__name__)
 
@@ -67,13 +67,15 @@ class Configuration:
         """
         path = Path(file_path).expanduser()
 
-        if not path.exists():
+        try:
+            stat = path.stat()
+        except OSError:
             logger.debug(f"Config file not found: {path}")
             return
 
         try:
-            with open(path, "r") as f:
-                data = json.load(f)
+            # Re-parsed only when the file changes
+            data = _read_config_file(str(path), stat.st_mtime_ns, stat.st_size)
 
             self._merge_dict(data)
             logger.info(f"Loaded configuration from {path}")
@@ -152,3 +154,14 @@ class Configuration:
     def __repr__(self) -> str:
         """String representation for debugging."""
         return f"Configuration({self.to_dict()})"
+
+
+@lru_cache(maxsize=4)
+def _read_config_file(path: str, _mtime_ns: int, _size: int) -> dict:
+    """Uncached parse behind Configuration.load_from_file().
+
+    _mtime_ns and _size are part of the cache key only, so an edited file
+    is parsed again. The returned dict is shared; callers must not mutate it.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
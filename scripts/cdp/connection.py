@@ -7,7 +7,8 @@ Handles WebSocket lifecycle, message routing, and error recovery.
 import asyncio
 import json
 import logging
-from typing import Any, Callable, Awaitable, Dict, List, Optional, Set
+import socket
+from typing import Any, Callable, Awaitable, Dict, List, Optional, Set, Tuple
 
 try:
     import websockets
@@ -29,6 +30,11 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# Event callbacks take the event params. Plain functions run inline in the
+# receive loop; coroutine functions (or functions returning an awaitable)
+# are scheduled as tasks.
+EventHandler = Callable[[dict], Optional[Awaitable[None]]]
+
 
 class CDPConnection:
     """Manages WebSocket connection to Chrome DevTools Protocol endpoint.
@@ -76,7 +82,7 @@ class CDPConnection:
         self._ws: Optional[WebSocketClientProtocol] = None
         self._next_command_id: int = 1
         self._pending_commands: Dict[int, asyncio.Future] = {}
-        self._event_handlers: Dict[str, List[Callable[[dict], Awaitable[None]]]] = {}
+        self._event_handlers: Dict[str, List[EventHandler]] = {}
         self._receive_task: Optional[asyncio.Task] = None
         self._enabled_domains: Set[str] = set()  # For domain replay after reconnection
         self._is_connected: bool = False
@@ -101,7 +107,13 @@ class CDPConnection:
         """
         try:
             logger.info(f"Connecting to {self.ws_url}")
-            self._ws = await websockets.connect(self.ws_url, max_size=self.max_size)  # type: ignore[assignment]
+            self._ws = await websockets.connect(  # type: ignore[assignment]
+                self.ws_url,
+                max_size=self.max_size,
+                # CDP runs over loopback, so deflate would only cost CPU
+                compression=None,
+            )
+            self._set_nodelay()
             self._is_connected = True
             self._receive_task = asyncio.create_task(self._receive_loop())
             logger.info("CDP connection established")
@@ -111,6 +123,22 @@ class CDPConnection:
                 details={"url": self.ws_url, "error": str(e)},
             )
 
+    def _set_nodelay(self) -> None:
+        """Disable Nagle's algorithm so small commands are sent immediately.
+
+        asyncio's default loop already does this for TCP transports; setting
+        it here keeps the guarantee for other loop implementations.
+        """
+        transport = getattr(self._ws, "transport", None)
+        sock = transport.get_extra_info("socket") if transport is not None else None
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        except OSError as e:
+            # Not a TCP socket (e.g. a Unix socket proxy)
+            logger.debug(f"Could not set TCP_NODELAY: {e}")
+
     async def disconnect(self) -> None:
         """Close WebSocket connection gracefully."""
         logger.info("Disconnecting CDP connection")
@@ -218,8 +246,9 @@ class CDPConnection:
                 logger.warning(f"Failed to replay domain {domain}: {e}")
 
     async def __aenter__(self) -> "CDPConnection":
-        """Context manager entry: connect automatically."""
-        await self.connect()
+        """Context manager entry: connect automatically (if not already connected)."""
+        if not self.is_connected:
+            await self.connect()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -251,21 +280,7 @@ class CDPConnection:
         if not self.is_connected:
             raise ConnectionClosedError("Cannot execute command: connection not active")
 
-        # Generate unique command ID
-        cmd_id = self._next_command_id
-        self._next_command_id += 1
-
-        # Create future for response
-        future: asyncio.Future = asyncio.Future()
-        self._pending_commands[cmd_id] = future
-
-        # Track enabled domains for reconnection replay
-        if method.endswith(".enable"):
-            domain = method.split(".")[0]
-            self._enabled_domains.add(domain)
-
-        # Send command
-        message = json.dumps({"id": cmd_id, "method": method, "params": params or {}})
+        cmd_id, future, message = self._prepare_command(method, params)
 
         try:
             await self._ws.send(message)  # type: ignore[union-attr]
@@ -284,14 +299,102 @@ class CDPConnection:
             # Clean up pending command
             self._pending_commands.pop(cmd_id, None)
 
-    def subscribe(
-        self, event_name: str, callback: Callable[[dict], Awaitable[None]]
-    ) -> None:
-        """Register async callback for CDP event.
+    async def execute_many(
+        self,
+        commands: List[Tuple[str, Optional[dict]]],
+        *,
+        timeout: Optional[float] = None,
+    ) -> List[dict]:
+        """Execute several CDP commands with a single round trip of latency.
+
+        All commands are sent back to back before any reply is awaited, so
+        they share TCP segments and are in flight together. Chrome runs the
+        commands of one session in order, so a later command can rely on
+        the effects of an earlier one.
+
+        Args:
+            commands: (method, params) pairs, sent in list order
+            timeout: Timeout in seconds for all replies (default: self.timeout)
+
+        Returns:
+            Result dicts in the same order as commands
+
+        Raises:
+            ConnectionClosedError: If connection is not active
+            CDPTimeoutError: If the replies do not all arrive in time
+            CommandFailedError: For the first command (in list order) that
+                Chrome rejected, once every reply has arrived
+        """
+        if not self.is_connected:
+            raise ConnectionClosedError("Cannot execute command: connection not active")
+
+        prepared = [self._prepare_command(method, params) for method, params in commands]
+        cmd_timeout = timeout if timeout is not None else self.timeout
+
+        try:
+            for _, _, message in prepared:
+                await self._ws.send(message)  # type: ignore[union-attr]
+            logger.debug(f"Sent {len(prepared)} pipelined commands")
+
+            results = await asyncio.wait_for(
+                asyncio.gather(
+                    *(future for _, future, _ in prepared), return_exceptions=True
+                ),
+                timeout=cmd_timeout,
+            )
+        except asyncio.TimeoutError as exc:
+            raise CDPTimeoutError(
+                "Command timed out",
+                command_method=", ".join(method for method, _ in commands),
+                timeout=cmd_timeout,
+            ) from exc
+        finally:
+            for cmd_id, _, _ in prepared:
+                self._pending_commands.pop(cmd_id, None)
+
+        responses: List[dict] = []
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+            responses.append(result)
+        return responses
+
+    def _prepare_command(
+        self, method: str, params: Optional[dict]
+    ) -> Tuple[int, asyncio.Future, str]:
+        """Assign an ID to a command and register its response future.
+
+        Args:
+            method: CDP method name
+            params: Method parameters (default: empty dict)
+
+        Returns:
+            (command ID, response future, JSON message to send)
+        """
+        # Generate unique command ID
+        cmd_id = self._next_command_id
+        self._next_command_id += 1
+
+        # Create future for response
+        future: asyncio.Future = asyncio.Future()
+        self._pending_commands[cmd_id] = future
+
+        # Track enabled domains for reconnection replay
+        if method.endswith(".enable"):
+            domain = method.split(".")[0]
+            self._enabled_domains.add(domain)
+
+        message = json.dumps({"id": cmd_id, "method": method, "params": params or {}})
+        return cmd_id, future, message
+
+    def subscribe(self, event_name: str, callback: EventHandler) -> None:
+        """Register callback for CDP event.
 
         Args:
             event_name: CDP event name (e.g., "Console.messageAdded")
-            callback: Async function with signature: async def callback(params: dict)
+            callback: Function with signature callback(params: dict). A plain
+                function is called inline by the receive loop, so it must not
+                block; an async function is run as a background task.
 
         Note:
             Remember to enable the corresponding CDP domain first.
@@ -302,9 +405,7 @@ class CDPConnection:
         self._event_handlers[event_name].append(callback)
         logger.debug(f"Subscribed to event: {event_name}")
 
-    def unsubscribe(
-        self, event_name: str, callback: Callable[[dict], Awaitable[None]]
-    ) -> None:
+    def unsubscribe(self, event_name: str, callback: EventHandler) -> None:
         """Remove event callback.
 
         Args:
@@ -357,14 +458,18 @@ class CDPConnection:
                     elif "method" in data:
                         event_name = data["method"]
                         params = data.get("params", {})
-                        logger.debug(f"Received event: {event_name}")
+                        logger.debug("Received event: %s", event_name)
 
-                        # Dispatch to registered handlers
-                        handlers = self._event_handlers.get(event_name, [])
+                        # Dispatch to registered handlers; most events on a
+                        # busy page have none, so avoid allocating a list
+                        handlers = self._event_handlers.get(event_name, ())
                         for handler in handlers:
                             try:
-                                # Run handler as background task (non-blocking)
-                                asyncio.create_task(handler(params))  # type: ignore[arg-type]
+                                # Plain handlers are done once they return;
+                                # coroutines run as background tasks
+                                pending = handler(params)
+                                if pending is not None:
+                                    asyncio.ensure_future(pending)
                             except Exception as e:
                                 # Isolate handler errors (Principle 6: Diagnostic Transparency)
                                 logger.error(
@@ -76,6 +76,33 @@ class TextFormatter(logging.Formatter):
         )
 
 
+class CLIFormatter(logging.Formatter):
+    """Formats CLI status and error messages as plain stderr text.
+
+    Used for the scripts.cdp.cli loggers, whose records are messages for the
+    person running the command rather than diagnostics, so they read the
+    same whatever --format is.
+
+    Example output:
+        Recording network activity for 10 seconds...
+        Error: Failed to connect to Chrome at http://localhost:9222/json
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as its message, with "Error: " for errors.
+
+        Args:
+            record: LogRecord instance
+
+        Returns:
+            Message text, followed by the traceback if one is attached
+        """
+        message = super().format(record)
+        if record.levelno >= logging.ERROR:
+            return f"Error: {message}"
+        return message
+
+
 def setup_logging(
     format_type: str = "text",
     level: Optional[str] = None,
@@ -136,6 +163,15 @@ def setup_logging(
     cdp_logger = logging.getLogger("scripts.cdp")
     cdp_logger.setLevel(log_level)
 
+    # CLI status and error messages go to stderr as plain text in every
+    # format; --quiet still filters them through the inherited level
+    cli_handler = logging.StreamHandler(sys.stderr)
+    cli_handler.setFormatter(CLIFormatter())
+    cli_logger = logging.getLogger("scripts.cdp.cli")
+    cli_logger.handlers.clear()
+    cli_logger.addHandler(cli_handler)
+    cli_logger.propagate = False
+
 
 def get_logger(name: str) -> logging.Logger:
     """Get logger instance for module.
@@ -7,10 +7,14 @@ Implements User Story 3: Unified CLI Interface - Target Discovery
 import json
 import urllib.request
 import urllib.error
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Tuple
 
 from .connection import CDPConnection
-from .exceptions import CDPError, CDPTargetNotFoundError
+from .exceptions import CDPError, CDPTargetNotFoundError, ConnectionFailedError
+
+
+# Page targets cached by CDPSession.find_page_by_url()
+MAX_CACHED_URL_TARGETS = 32
 
 
 class Target:
@@ -61,6 +65,12 @@ class Target:
         return f"Target(id={self.id!r}, type={self.type!r}, url={self.url!r})"
 
 
+# Page targets found by find_page_by_url(), keyed by (chrome_host,
+# chrome_port, url_pattern); the oldest entry is dropped once
+# MAX_CACHED_URL_TARGETS are held
+_url_targets: Dict[Tuple[str, int, str], Target] = {}
+
+
 class CDPSession:
     """
     Session manager for discovering Chrome targets and creating CDP connections.
@@ -140,19 +150,19 @@ class CDPSession:
                 details={"endpoint": endpoint_url},
             ) from e
 
-        # Convert to Target objects
-        targets = [Target(data) for data in targets_data]
-
-        # Apply filters
+        # Apply filters to the raw entries, so only matching targets are
+        # converted to Target objects
         if target_type:
-            targets = [t for t in targets if t.type == target_type]
+            targets_data = [d for d in targets_data if d.get("type") == target_type]
 
         if url_pattern:
             # Case-insensitive substring match (simple pattern matching)
-            url_pattern_lower = url_pattern.lower()
-            targets = [t for t in targets if url_pattern_lower in t.url.lower()]
+            needle = url_pattern.lower()
+            targets_data = [
+                d for d in targets_data if needle in d.get("url", "").lower()
+            ]
 
-        return targets
+        return [Target(data) for data in targets_data]
 
     def get_target_by_id(self, target_id: str) -> Optional[Target]:
         """
@@ -173,6 +183,78 @@ class CDPSession:
                 return target
         return None
 
+    def find_page_by_url(self, url_pattern: str) -> Target:
+        """
+        Find the first page target whose URL contains url_pattern.
+
+        Results are cached per process (host, port and pattern), so repeated
+        lookups in one run, e.g. by the repl, skip the /json round trip.
+        connect_to_url() re-checks a cached target and drops it when it is
+        gone or has navigated away.
+
+        Args:
+            url_pattern: Case-insensitive URL substring
+
+        Returns:
+            Matching page Target
+
+        Raises:
+            CDPTargetNotFoundError: If no page target matches (not cached)
+            CDPError: If HTTP endpoint is unreachable
+        """
+        key = (self.chrome_host, self.chrome_port, url_pattern)
+        target = _url_targets.get(key)
+        if target is None:
+            targets = self.list_targets(target_type="page", url_pattern=url_pattern)
+            if not targets:
+                raise CDPTargetNotFoundError(
+                    f"No page target matching URL: {url_pattern}",
+                    url_pattern=url_pattern,
+                )
+            target = targets[0]
+            if len(_url_targets) >= MAX_CACHED_URL_TARGETS:
+                del _url_targets[next(iter(_url_targets))]  # oldest first
+            _url_targets[key] = target
+        return target
+
+    async def connect_to_url(self, url_pattern: str) -> CDPConnection:
+        """
+        Connect to the first page target whose URL contains url_pattern.
+
+        If the connection fails the cached lookup may be stale (tab closed or
+        reloaded under a new ID); a target served from the cache is also
+        checked to still show a matching URL. Either way only this pattern's
+        cache entry is dropped, and the lookup and connection are retried
+        once.
+
+        Args:
+            url_pattern: Case-insensitive URL substring
+
+        Returns:
+            Connected CDPConnection
+
+        Raises:
+            CDPTargetNotFoundError: If no page target matches
+            ConnectionFailedError: If the retry fails as well
+        """
+        key = (self.chrome_host, self.chrome_port, url_pattern)
+        cached = key in _url_targets
+
+        conn = await self.connect_to_target(self.find_page_by_url(url_pattern))
+        try:
+            await conn.connect()
+        except ConnectionFailedError:
+            pass  # retried below with a fresh lookup
+        else:
+            if not cached or await _page_url_matches(conn, url_pattern):
+                return conn
+            await conn.disconnect()  # the tab navigated away
+
+        _url_targets.pop(key, None)
+        conn = await self.connect_to_target(self.find_page_by_url(url_pattern))
+        await conn.connect()
+        return conn
+
     async def connect_to_target(self, target: Target) -> CDPConnection:
         """
         Create CDPConnection for given target.
@@ -218,3 +300,12 @@ class CDPSession:
             )
 
         return await self.connect_to_target(targets[0])
+
+
+async def _page_url_matches(conn: CDPConnection, url_pattern: str) -> bool:
+    """Whether the connected page's current URL still contains url_pattern."""
+    try:
+        result = await conn.execute_command("Target.getTargetInfo")
+    except CDPError:
+        return False  # cannot tell, so treat the cached target as stale
+    return url_pattern.lower() in result["targetInfo"]["url"].lower()
@@ -8,6 +8,29 @@ import asyncio
 import websockets
 import argparse
 
+try:
+    import uvloop
+except ImportError:  # optional speedup, use the default asyncio loop
+    uvloop = None
+
+run = uvloop.run if uvloop is not None else asyncio.run
+
+# CDP runs over loopback, so deflate only costs CPU. Deeper receive queue
+# and write buffer mean fewer pause/resume cycles during request floods.
+CONNECT_KWARGS = {
+    'max_size': None,
+    'max_queue': 1024,
+    'write_limit': 2 ** 20,
+    'compression': None,
+}
+
+# Outbound command envelopes, constant except for the id and any
+# JSON-encoded arguments
+DOM_ENABLE_TMPL = '{"id":%d,"method":"DOM.enable"}'
+RUNTIME_ENABLE_TMPL = '{"id":%d,"method":"Runtime.enable"}'
+PAGE_NAVIGATE_TMPL = '{"id":%d,"method":"Page.navigate","params":{"url":%s}}'
+RUNTIME_EVALUATE_TMPL = '{"id":%d,"method":"Runtime.evaluate","params":%s}'
+
 async def monitor_dom(page_id, url=None, port=9222, selector=None, poll_interval=1.0, duration=None):
     """
     Monitor DOM for form field changes using mutation observers.
@@ -21,28 +44,25 @@ async def monitor_dom(page_id, url=None, port=9222, selector=None, poll_interval
         duration: Maximum duration to monitor (seconds)
     """
     ws_url = f'ws://localhost:{port}/devtools/page/{page_id}'
-    msg_id = 1
 
-    async with websockets.connect(ws_url) as ws:
+    async with websockets.connect(ws_url, **CONNECT_KWARGS) as ws:
         print(f'Connected to CDP (port {port})', file=sys.stderr)
 
-        # Enable DOM domain
-        await ws.send(json.dumps({'id': msg_id, 'method': 'DOM.enable'}))
-        msg_id += 1
+        # Enable DOM and Runtime (for JavaScript execution), then navigate
+        commands = [(DOM_ENABLE_TMPL, ()), (RUNTIME_ENABLE_TMPL, ())]
+        if url:
+            print(f'Navigating to: {url}', file=sys.stderr)
+            commands.append((PAGE_NAVIGATE_TMPL, (json.dumps(url),)))
 
-        # Enable Runtime for JavaScript execution
-        await ws.send(json.dumps({'id': msg_id, 'method': 'Runtime.enable'}))
-        msg_id += 1
+        # Queue all setup commands at once so the frames share one write
+        envelopes = [
+            template % ((msg_id,) + args)
+            for msg_id, (template, args) in enumerate(commands, start=1)
+        ]
+        await asyncio.gather(*[ws.send(envelope) for envelope in envelopes])
+        msg_id = len(envelopes) + 1
 
-        # Navigate if URL provided
         if url:
-            print(f'Navigating to: {url}', file=sys.stderr)
-            await ws.send(json.dumps({
-                'id': msg_id,
-                'method': 'Page.navigate',
-                'params': {'url': url}
-            }))
-            msg_id += 1
             await asyncio.sleep(2)  # Wait for page load
 
         print(f'Monitoring DOM changes...', file=sys.stderr)
@@ -103,6 +123,12 @@ async def monitor_dom(page_id, url=None, port=9222, selector=None, poll_interval
         })
         """
 
+        # The evaluate params never change between polls, so encode them once
+        evaluate_params = json.dumps({
+            'expression': f'({extract_js})({json.dumps(selector)})',
+            'returnByValue': True
+        })
+
         # Track previous values to detect changes
         previous_state = {}
         is_first_run = True
@@ -120,14 +146,7 @@ async def monitor_dom(page_id, url=None, port=9222, selector=None, poll_interval
                         break
 
                 # Evaluate JavaScript to get current form state
-                await ws.send(json.dumps({
-                    'id': msg_id,
-                    'method': 'Runtime.evaluate',
-                    'params': {
-                        'expression': f'({extract_js})({json.dumps(selector)})',
-                        'returnByValue': True
-                    }
-                }))
+                await ws.send(RUNTIME_EVALUATE_TMPL % (msg_id, evaluate_params))
                 eval_msg_id = msg_id
                 msg_id += 1
 
@@ -138,8 +157,11 @@ async def monitor_dom(page_id, url=None, port=9222, selector=None, poll_interval
 
                     # Check if this is our eval response
                     if result.get('id') == eval_msg_id:
-                        if 'result' in result and 'result' in result['result']:
-                            data = result['result']['result']['value']
+                        remote_object = result.get('result', {}).get('result')
+                        if remote_object is not None:
+                            data = remote_object['value']
+                            timestamp = data['timestamp']
+                            fields = data['fields']
 
                             # Check for changes
                             current_state = {}
@@ -149,28 +171,29 @@ async def monitor_dom(page_id, url=None, port=9222, selector=None, poll_interval
                             if is_first_run:
                                 print(json.dumps({
                                     'event': 'initial_state',
-                                    'timestamp': data['timestamp'],
+                                    'timestamp': timestamp,
                                     'count': data['count'],
-                                    'fields': data['fields']
+                                    'fields': fields
                                 }), flush=True)
                                 is_first_run = False
 
-                            for field in data['fields']:
+                            for field in fields:
                                 # Create a unique key for this field
                                 key = f"{field.get('name', '')}:{field.get('id', '')}:{field.get('type', '')}"
                                 current_value = field.get('value', '')
 
                                 current_state[key] = current_value
+                                previous_value = previous_state.get(key)
 
                                 # Detect changes (skip on first run since we already reported initial state)
-                                if key in previous_state:
-                                    if previous_state[key] != current_value:
+                                if previous_value is not None:
+                                    if previous_value != current_value:
                                         changes_detected = True
                                         print(json.dumps({
                                             'event': 'field_changed',
-                                            'timestamp': data['timestamp'],
+                                            'timestamp': timestamp,
                                             'field': field,
-                                            'old_value': previous_state[key],
+                                            'old_value': previous_value,
                                             'new_value': current_value
                                         }), flush=True)
                                 else:
@@ -179,7 +202,7 @@ async def monitor_dom(page_id, url=None, port=9222, selector=None, poll_interval
                                         changes_detected = True
                                         print(json.dumps({
                                             'event': 'field_detected',
-                                            'timestamp': data['timestamp'],
+                                            'timestamp': timestamp,
                                             'field': field
                                         }), flush=True)
 
@@ -211,7 +234,7 @@ if __name__ == '__main__':
     args = parser.parse_args()
 
     try:
-        asyncio.run(monitor_dom(
+        run(monitor_dom(
             args.page_id,
             args.url,
             args.port,
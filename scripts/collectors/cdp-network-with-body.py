@@ -1,173 +1,305 @@
 #!/usr/bin/env python3
 """Capture Chrome DevTools network traffic including response bodies."""
 
+import argparse
 import asyncio
-import base64
 import json
 import sys
 
-import websockets
+from functools import partial
+
 from websockets.exceptions import WebSocketException
 
-if len(sys.argv) < 2:
-    print(
-        'Usage: cdp-network-with-body.py <page-id> [url] '
-        '[--port=9222] [--filter=pattern] [--idle-timeout=seconds]',
-        file=sys.stderr,
-    )
-    sys.exit(1)
-
-# Parse arguments
-page_id = sys.argv[1]
-url = None
-port = 9222
-url_filter = None
-idle_timeout = None
-
-for arg in sys.argv[2:]:
-    if arg.startswith('--port='):
-        port = int(arg.split('=')[1])
-    elif arg.startswith('--filter='):
-        url_filter = arg.split('=')[1]
-    elif arg.startswith('--idle-timeout='):
-        try:
-            idle_timeout = float(arg.split('=')[1])
-        except ValueError:
-            print('Invalid idle-timeout value', file=sys.stderr)
-            sys.exit(1)
-    elif not arg.startswith('--'):
-        url = arg
+try:
+    # websockets >= 13: recv(decode=False) hands back the raw frame bytes
+    from websockets.asyncio.client import connect
+    RECV_BYTES = True
+except ImportError:
+    from websockets import connect
+    RECV_BYTES = False
 
-WS_URL = f'ws://localhost:{port}/devtools/page/{page_id}'
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
 
+if orjson is not None:
+    loads = orjson.loads
+    dumps = orjson.dumps
+else:
+    loads = json.loads
 
-async def monitor_network():
-    """Stream CDP network events, optionally capturing response bodies."""
-    msg_id = 1
-    response_bodies = {}  # Store request IDs for responses we want to capture
+    def dumps(obj):
+        return json.dumps(obj).encode()
 
-    async with websockets.connect(WS_URL) as ws:
-        print(f'Connected to CDP (port {port})', file=sys.stderr)
+try:
+    import simdjson
+except ImportError:  # optional speedup, messages are fully parsed with loads()
+    simdjson = None
+
+try:
+    from pybase64 import b64decode  # SIMD-accelerated, same API
+except ImportError:
+    from base64 import b64decode
+
+try:
+    import uvloop
+except ImportError:  # optional speedup, use the default asyncio loop
+    uvloop = None
+
+run = uvloop.run if uvloop is not None else asyncio.run
+
+# Pre-built JSONL event lines; only the field values go through dumps(),
+# which handles the string escaping, so no dict is built per event
+REQUEST_TMPL = b'{"event":"request","url":%s,"method":%s,"requestId":%s}\n'
+RESPONSE_TMPL = (
+    b'{"event":"response","url":%s,"status":%s,"statusText":%s,'
+    b'"mimeType":%s,"requestId":%s}\n'
+)
+RESPONSE_BODY_TMPL = b'{"event":"response_body","body":%s}\n'
+RESPONSE_BODY_B64_TMPL = b'{"event":"response_body","body_b64":%s}\n'
+FAILED_TMPL = b'{"event":"failed","errorText":%s,"requestId":%s}\n'
+
+# With --decode-base64, bodies larger than this are decoded in a worker
+# thread so a multi-MB payload does not stall the event stream
+DECODE_INLINE_LIMIT = 64 * 1024
+
+# CDP runs over loopback, so deflate only costs CPU. Deeper receive queue
+# and write buffer mean fewer pause/resume cycles during request floods.
+CONNECT_KWARGS = {
+    'max_size': None,
+    'max_queue': 1024,
+    'write_limit': 2 ** 20,
+    'compression': None,
+}
+
+# Outbound command envelopes, constant except for the id and any
+# JSON-encoded arguments (str, so websockets sends text frames)
+NETWORK_ENABLE_TMPL = '{"id":%d,"method":"Network.enable"}'
+PAGE_NAVIGATE_TMPL = '{"id":%d,"method":"Page.navigate","params":{"url":%s}}'
+GET_RESPONSE_BODY_TMPL = '{"id":%d,"method":"Network.getResponseBody","params":{"requestId":%s}}'
+
+
+# Stdout is flushed once this much output is pending, or FLUSH_DELAY seconds
+# after the first unflushed line, whichever comes first
+FLUSH_THRESHOLD = 32 * 1024
+FLUSH_DELAY = 0.01
+
+
+class StdoutBatcher:
+    """Accumulate event lines and write them to stdout in batches."""
+
+    def __init__(self):
+        self._buffer = bytearray()
+        self._timer = None
+
+    def write(self, line):
+        self._buffer += line
+        if len(self._buffer) >= FLUSH_THRESHOLD:
+            self.flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(FLUSH_DELAY, self.flush)
+
+    def flush(self):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._buffer:
+            sys.stdout.buffer.write(self._buffer)
+            sys.stdout.buffer.flush()
+            self._buffer.clear()
+
+
+output = StdoutBatcher()
+
+
+def decode_body(body):
+    """Decode a base64 response body to text, dropping invalid UTF-8."""
+    return b64decode(body).decode('utf-8', errors='ignore')
+
+
+def emit_request(params, write):
+    """Emit a request event for Network.requestWillBeSent."""
+    request = params['request']
+    write(REQUEST_TMPL % (
+        dumps(request['url']),
+        dumps(request['method']),
+        dumps(params['requestId']),
+    ))
+
+
+def emit_response(params, write):
+    """Emit a response event for Network.responseReceived."""
+    response = params['response']
+    write(RESPONSE_TMPL % (
+        dumps(response['url']),
+        dumps(response['status']),
+        dumps(response['statusText']),
+        dumps(response['mimeType']),
+        dumps(params['requestId']),
+    ))
+
+
+def emit_failed(params, write):
+    """Emit a failed event for Network.loadingFailed."""
+    write(FAILED_TMPL % (
+        dumps(params['errorText']),
+        dumps(params['requestId']),
+    ))
 
-        # Enable network domain
-        await ws.send(json.dumps({'id': msg_id, 'method': 'Network.enable'}))
-        msg_id += 1
 
-        # Navigate if URL provided
+# CDP event method -> handler, used when no --filter is given
+HANDLERS = {
+    'Network.requestWillBeSent': emit_request,
+    'Network.responseReceived': emit_response,
+    'Network.loadingFailed': emit_failed,
+}
+
+
+async def monitor_network(page_id, url=None, port=9222, url_filter=None, idle_timeout=None,
+                          decode_base64=False):
+    """
+    Stream CDP network events, optionally capturing response bodies.
+
+    Args:
+        page_id: CDP page ID
+        url: Optional URL to navigate to first
+        port: CDP debugging port
+        url_filter: Only report responses whose URL contains this string,
+            and capture their bodies
+        idle_timeout: Stop after this many seconds without a message
+        decode_base64: Emit base64 bodies decoded as text instead of as body_b64
+    """
+    ws_url = f'ws://localhost:{port}/devtools/page/{page_id}'
+    body_requests = []  # Request IDs whose bodies still need fetching
+    large_bodies = []  # base64 bodies too large to decode on the loop thread
+
+    async with connect(ws_url, **CONNECT_KWARGS) as ws:
+        print(f'Connected to CDP (port {port})', file=sys.stderr)
+
+        # Enable network domain, then navigate if URL provided
+        commands = [(NETWORK_ENABLE_TMPL, ())]
         if url:
             print(f'Navigating to: {url}', file=sys.stderr)
-            await ws.send(
-                json.dumps({
-                    'id': msg_id,
-                    'method': 'Page.navigate',
-                    'params': {'url': url},
-                })
-            )
-            msg_id += 1
+            commands.append((PAGE_NAVIGATE_TMPL, (dumps(url).decode(),)))
 
-        # Listen for messages
-        while True:
-            try:
-                if idle_timeout:
-                    message = await asyncio.wait_for(ws.recv(), timeout=idle_timeout)
-                else:
-                    message = await ws.recv()
-            except asyncio.TimeoutError:
-                print(f'Idle timeout reached after {idle_timeout} seconds', file=sys.stderr)
-                break
-
-            msg = json.loads(message)
-
-            # Track requests that match our filter
-            if msg.get('method') == 'Network.responseReceived':
-                response = msg['params']['response']
-                request_id = msg['params']['requestId']
-                response_url = response['url']
-
-                # If we have a filter and this URL matches, request the body
-                if url_filter and url_filter in response_url:
-                    response_bodies[request_id] = response_url
-
-                    # Request the response body
-                    await ws.send(
-                        json.dumps({
-                            'id': msg_id,
-                            'method': 'Network.getResponseBody',
-                            'params': {'requestId': request_id},
-                        })
-                    )
-                    msg_id += 1
+        # Queue all setup commands at once so websockets can coalesce the
+        # frames into a single write instead of one round trip each
+        envelopes = [
+            template % ((msg_id,) + args)
+            for msg_id, (template, args) in enumerate(commands, start=1)
+        ]
+        await asyncio.gather(*[ws.send(envelope) for envelope in envelopes])
+        msg_id = len(envelopes) + 1
+
+        def emit_filtered_response(params, write):
+            # Only responses whose URL matches the filter are reported,
+            # and their bodies are requested
+            if url_filter in params['response']['url']:
+                body_requests.append(params['requestId'])
+                emit_response(params, write)
+
+        if url_filter:
+            handlers = {'Network.responseReceived': emit_filtered_response}
+        else:
+            handlers = HANDLERS
+        write = output.write
+        loop = asyncio.get_running_loop()
+
+        # Text frames are valid UTF-8 JSON; skip decoding them to str only for
+        # the JSON parser to scan the same bytes again
+        recv = partial(ws.recv, decode=False) if RECV_BYTES else ws.recv
+
+        if simdjson is not None:
+            # On-demand parsing: only the fields a handler touches are
+            # converted to Python objects. The parser reuses its buffer, so
+            # a document must not outlive the handle_message() call.
+            parser = simdjson.Parser()
+
+            def parse(message):
+                if isinstance(message, str):
+                    message = message.encode()
+                return parser.parse(message)
+        else:
+            parse = loads
 
-                    print(
-                        json.dumps({
-                            'event': 'response',
-                            'url': response_url,
-                            'status': response['status'],
-                            'statusText': response['statusText'],
-                            'mimeType': response['mimeType'],
-                            'requestId': request_id,
-                        }),
-                        flush=True,
-                    )
+        def handle_message(message):
+            msg = parse(message)
+
+            handler = handlers.get(msg.get('method'))
+            if handler is not None:
+                handler(msg['params'], write)
+                return
 
             # Handle response body
-            elif msg.get('result') and 'body' in msg.get('result', {}):
-                body = msg['result']['body']
-                base64_encoded = msg['result'].get('base64Encoded', False)
-
-                if base64_encoded:
-                    body = base64.b64decode(body).decode(
-                        'utf-8', errors='ignore'
-                    )
-
-                print(
-                    json.dumps({
-                        'event': 'response_body',
-                        'body': body,
-                    }),
-                    flush=True,
-                )
-
-            # Also output regular network events if no filter
-            elif not url_filter:
-                if msg.get('method') == 'Network.requestWillBeSent':
-                    print(
-                        json.dumps({
-                            'event': 'request',
-                            'url': msg['params']['request']['url'],
-                            'method': msg['params']['request']['method'],
-                            'requestId': msg['params']['requestId'],
-                        }),
-                        flush=True,
-                    )
-
-                elif msg.get('method') == 'Network.responseReceived':
-                    response = msg['params']['response']
-                    print(
-                        json.dumps({
-                            'event': 'response',
-                            'url': response['url'],
-                            'status': response['status'],
-                            'statusText': response['statusText'],
-                            'mimeType': response['mimeType'],
-                            'requestId': msg['params']['requestId'],
-                        }),
-                        flush=True,
-                    )
-
-                elif msg.get('method') == 'Network.loadingFailed':
-                    print(
-                        json.dumps({
-                            'event': 'failed',
-                            'errorText': msg['params']['errorText'],
-                            'requestId': msg['params']['requestId'],
-                        }),
-                        flush=True,
-                    )
+            result = msg.get('result')
+            if result and 'body' in result:
+                body = result['body']
+
+                # Binary bodies are passed through still base64-encoded;
+                # decoding is left to the consumer unless --decode-base64
+                if not result.get('base64Encoded', False):
+                    write(RESPONSE_BODY_TMPL % dumps(body))
+                elif not decode_base64:
+                    write(RESPONSE_BODY_B64_TMPL % dumps(body))
+                elif len(body) > DECODE_INLINE_LIMIT:
+                    large_bodies.append(body)
+                else:
+                    write(RESPONSE_BODY_TMPL % dumps(decode_body(body)))
+
+        # Listen for messages
+        try:
+            while True:
+                try:
+                    if idle_timeout:
+                        message = await asyncio.wait_for(recv(), timeout=idle_timeout)
+                    else:
+                        message = await recv()
+                except asyncio.TimeoutError:
+                    print(f'Idle timeout reached after {idle_timeout} seconds', file=sys.stderr)
+                    break
+
+                handle_message(message)
+
+                while large_bodies:
+                    text = await loop.run_in_executor(None, decode_body, large_bodies.pop())
+                    write(RESPONSE_BODY_TMPL % dumps(text))
+
+                # Request bodies for responses matched by the filter
+                while body_requests:
+                    await ws.send(GET_RESPONSE_BODY_TMPL % (
+                        msg_id, dumps(body_requests.pop()).decode()
+                    ))
+                    msg_id += 1
+        finally:
+            output.flush()
 
 if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description='Capture Chrome DevTools network traffic including response bodies'
+    )
+    parser.add_argument('page_id', help='CDP page ID')
+    parser.add_argument('url', nargs='?', help='URL to navigate to (optional)')
+    parser.add_argument('--port', type=int, default=9222, help='CDP debugging port (default: 9222)')
+    parser.add_argument('--filter', dest='url_filter', metavar='PATTERN',
+                        help='Only report responses whose URL contains PATTERN, with bodies')
+    parser.add_argument('--idle-timeout', type=float, metavar='SECONDS',
+                        help='Exit after this many seconds without network activity')
+    parser.add_argument('--decode-base64', action='store_true',
+                        help='Decode base64 response bodies to text instead of emitting body_b64')
+
+    # Intermixed so the URL may follow the options, as the old parser allowed
+    args = parser.parse_intermixed_args()
+
     try:
-        asyncio.run(monitor_network())
+        run(monitor_network(
+            args.page_id,
+            args.url,
+            args.port,
+            args.url_filter,
+            args.idle_timeout,
+            args.decode_base64
+        ))
     except KeyboardInterrupt:
         print('\nConnection closed', file=sys.stderr)
     except WebSocketException as error:
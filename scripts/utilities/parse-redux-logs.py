@@ -12,85 +12,292 @@ Examples:
 
 import re
 import json
+import mmap
+import os
 import sys
 import argparse
+from contextlib import nullcontext
 from datetime import datetime
+from itertools import islice
+from multiprocessing import Pool
 from pathlib import Path
 
-# T053: Regex patterns for redux-logger format
-REDUX_ACTION_PATTERN = r'action\s+(.+?)\s+@\s+(\d{2}:\d{2}:\d{2}\.\d{3})'
-PREV_STATE_PATTERN = r'prev state\s+(.+?)(?=\n|$)'
-NEXT_STATE_PATTERN = r'next state\s+(.+?)(?=\n|$)'
+try:
+    import simdjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    simdjson = None
+
+try:
+    import orjson
+except ImportError:  # optional speedup, fall back to stdlib json
+    orjson = None
+
+# T053: Regex patterns for redux-logger format, fused into one alternation so
+# each line is scanned once; m.lastgroup tells which kind of line matched.
+# Patterns run over the raw file bytes, so whitespace excludes newlines to
+# keep every match on a single line.
+REDUX_LINE_RE = re.compile(
+    rb'(?P<action>action[^\S\n]+(?P<action_type>.+?)[^\S\n]+@[^\S\n]+'
+    rb'(?P<timestamp>\d{2}:\d{2}:\d{2}\.\d{3}))'
+    rb'|(?P<prev>prev state[^\S\n]+(?P<prev_state>.+?)$)'
+    rb'|(?P<next>next state[^\S\n]+(?P<next_state>.+?)$)',
+    re.MULTILINE,
+)
+OBJECT_PREFIX_RE = re.compile(rb'^Object\s+')
+
+# Logs at least this large are parsed by a pool of worker processes
+PARALLEL_MIN_SIZE = 8 * 1024 * 1024
+# Raw events handed to a worker per task
+CHUNK_EVENTS = 1024
+
+# Matched group name -> (captured state group, timeline key)
+STATE_GROUPS = {
+    'prev': ('prev_state', 'prevState'),
+    'next': ('next_state', 'nextState'),
+}
+
+class NonFiniteFloat(float):
+    """
+    NaN/Infinity parsed from a state blob.
+
+    orjson would silently write these as null; as an unknown float subclass
+    they make orjson raise instead, so dumps_indented falls back to stdlib
+    json, which writes them back out as NaN/Infinity like the input.
+    """
+
 
 # T054: Safe JSON parsing with error handling
-def parse_json_safe(json_str):
+def parse_json_safe(json_bytes):
     """
-    Attempt to parse JSON, return parsed object or original string if fails.
+    Attempt to parse JSON bytes, return parsed object or original string if fails.
     Returns: (parsed_value, success_boolean)
+
+    With pysimdjson installed the parsed value is a lazy simdjson document;
+    it is only walked once, when the timeline is serialized. Each document
+    gets its own Parser because a parser can back only one live document.
     """
     # Remove "Object " prefix if present
-    json_str = re.sub(r'^Object\s+', '', json_str.strip())
+    json_bytes = OBJECT_PREFIX_RE.sub(b'', json_bytes.strip())
+
+    if simdjson is not None:
+        try:
+            return simdjson.Parser().parse(json_bytes), True
+        except (ValueError, RuntimeError):
+            # Retry below: invalid UTF-8 is dropped, as when reading text;
+            # NaN/Infinity and integers beyond 64 bits (RuntimeError) are
+            # only understood by the stdlib parser
+            pass
 
+    json_str = json_bytes.decode('utf-8', errors='ignore')
     try:
-        return json.loads(json_str), True
+        return json.loads(json_str, parse_constant=NonFiniteFloat), True
     except json.JSONDecodeError:
         return json_str, False
 
+
+def materialize(value):
+    """json.dump default hook: convert lazy simdjson documents to dict/list."""
+    if hasattr(value, 'as_dict'):
+        return value.as_dict()
+    if hasattr(value, 'as_list'):
+        return value.as_list()
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON serializable')
+
+def dumps_indented(value):
+    """Serialize value as 2-space indented JSON bytes, via orjson when available."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(value, default=materialize, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass  # integers beyond 64 bits, NonFiniteFloat; stdlib json handles those
+    return json.dumps(value, indent=2, default=materialize).encode()
+
+
+class TimelineBuffer:
+    """
+    Timeline events serialized as soon as they are parsed.
+
+    Each event goes straight into a bytearray of JSON, already indented for
+    its place in the output file, so parsed state trees are not kept alive
+    until the whole log has been read. Only the counters stay in Python.
+    """
+
+    def __init__(self):
+        self.data = bytearray()
+        self.count = 0
+        self.successful = 0
+
+    def __len__(self):
+        return self.count
+
+    def append(self, event):
+        if self.count:
+            self.data += b',\n'
+        self.data += b'    ' + dumps_indented(event).replace(b'\n', b'\n    ')
+        self.count += 1
+        if event['parsedSuccessfully']:
+            self.successful += 1
+
+    def extend(self, other):
+        """Append the already serialized events of another buffer."""
+        if not other.count:
+            return
+        if self.count:
+            self.data += b',\n'
+        self.data += other.data
+        self.count += other.count
+        self.successful += other.successful
+
+
+def write_output(metadata, timeline, output_file):
+    """Write metadata and the serialized timeline as one indented JSON document."""
+    with open(output_file, 'wb') as f:
+        f.write(b'{\n  "metadata": ')
+        f.write(dumps_indented(metadata).replace(b'\n', b'\n  '))
+        f.write(b',\n  "timeline": ')
+        if timeline:
+            f.write(b'[\n')
+            f.write(timeline.data)
+            f.write(b'\n  ]')
+        else:
+            f.write(b'[]')
+        f.write(b'\n}\n')
+
+# T056-T059: Group log lines into raw events
+def scan_events(data):
+    """
+    Yield raw events from the log bytes without parsing any JSON.
+
+    Each raw event is (timestamp, action_type, states), where states lists
+    (timeline_key, state_bytes, offset) for every prev/next state line that
+    follows the action line. State lines before the first action are ignored.
+    """
+    current = None
+    for match in REDUX_LINE_RE.finditer(data):
+        kind = match.lastgroup
+        if kind == 'action':
+            if current is not None:
+                yield current
+            current = (match.group('timestamp'), match.group('action_type'), [])
+        elif current is not None:
+            group, key = STATE_GROUPS[kind]
+            current[2].append((key, match.group(group), match.start()))
+
+    if current is not None:
+        yield current
+
+
+# T056-T058: Build one timeline event
+def build_event(raw):
+    """
+    Parse the states of a raw event.
+    Returns: (event_dict, failures) where failures lists (offset, timeline_key)
+    for each state whose JSON could not be parsed.
+    """
+    timestamp, action_type, states = raw
+
+    # Apps reuse a few dozen action types thousands of times, so intern them
+    action_type = action_type.strip().decode('utf-8', errors='ignore')
+    event = {
+        'timestamp': timestamp.decode(),
+        'actionType': sys.intern(action_type),
+        'prevState': None,
+        'nextState': None,
+        'parsedSuccessfully': True
+    }
+    failures = []
+    for key, state_bytes, offset in states:
+        state, success = parse_json_safe(state_bytes)
+        event[key] = state
+        if not success:
+            failures.append((offset, key))
+            event['parsedSuccessfully'] = False
+    return event, failures
+
+
+def parse_chunk(raws):
+    """
+    Worker entry point: build and serialize a chunk of raw events.
+    Returns: (TimelineBuffer, failures)
+    """
+    timeline = TimelineBuffer()
+    failures = []
+    for raw in raws:
+        event, event_failures = build_event(raw)
+        timeline.append(event)
+        failures.extend(event_failures)
+    return timeline, failures
+
+
+def chunked(iterable, size):
+    """Yield lists of up to size items from iterable."""
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def map_file(f):
+    """
+    Memory-map an open file read-only, for use as a context manager.
+
+    The regex then walks the page cache directly instead of allocating a str
+    per line. Empty files cannot be mapped and yield b'' instead.
+    """
+    try:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        return nullcontext(b'')
+
+
 # T055-T063: Main parsing loop
-def parse_redux_logs(log_file_path):
+def parse_redux_logs(log_file_path, jobs=None):
     """
     Parse console log file and extract Redux state timeline.
-    Returns: (timeline_list, warnings_list)
+
+    Logs of PARALLEL_MIN_SIZE or more are split into chunks of raw events
+    whose JSON is parsed and serialized by `jobs` worker processes
+    (default: CPU count). Chunks are collected in order, so the output is
+    the same as a serial run.
+
+    Returns: (TimelineBuffer, warnings_list)
     """
-    timeline = []
-    current_event = {}
+    timeline = TimelineBuffer()
     warnings = []
 
+    if jobs is None:
+        jobs = os.cpu_count() or 1
+
     try:
-        with open(log_file_path, 'r', encoding='utf-8', errors='ignore') as f:
-            for line_num, line in enumerate(f, 1):
-                # T056: Match action line
-                action_match = re.search(REDUX_ACTION_PATTERN, line)
-                if action_match:
-                    # Save previous event if exists
-                    if current_event:
-                        timeline.append(current_event)
-
-                    # T056: Create new event
-                    current_event = {
-                        'timestamp': action_match.group(2),
-                        'actionType': action_match.group(1).strip(),
-                        'prevState': None,
-                        'nextState': None,
-                        'parsedSuccessfully': True
-                    }
-                    continue
-
-                # T057: Match prev state
-                prev_match = re.search(PREV_STATE_PATTERN, line)
-                if prev_match and current_event:
-                    state_str = prev_match.group(1).strip()
-                    state, success = parse_json_safe(state_str)
-                    current_event['prevState'] = state
-                    if not success:
-                        warnings.append(f"Line {line_num}: Malformed prevState JSON")
-                        current_event['parsedSuccessfully'] = False
-                    continue
-
-                # T058: Match next state
-                next_match = re.search(NEXT_STATE_PATTERN, line)
-                if next_match and current_event:
-                    state_str = next_match.group(1).strip()
-                    state, success = parse_json_safe(state_str)
-                    current_event['nextState'] = state
-                    if not success:
-                        warnings.append(f"Line {line_num}: Malformed nextState JSON")
-                        current_event['parsedSuccessfully'] = False
-                    continue
-
-            # T059: Save last event
-            if current_event:
-                timeline.append(current_event)
+        with open(log_file_path, 'rb') as f, map_file(f) as data:
+            # Line numbers are only needed for warnings; count lazily
+            counted_pos = 0
+            line_num = 1
+
+            def add_warnings(failures):
+                nonlocal counted_pos, line_num
+                for offset, key in failures:
+                    line_num += data[counted_pos:offset].count(b'\n')
+                    counted_pos = offset
+                    warnings.append(f"Line {line_num}: Malformed {key} JSON")
+
+            raws = scan_events(data)
+            try:
+                if jobs > 1 and len(data) >= PARALLEL_MIN_SIZE:
+                    with Pool(jobs) as pool:
+                        for chunk_timeline, failures in pool.imap(
+                            parse_chunk, chunked(raws, CHUNK_EVENTS)
+                        ):
+                            timeline.extend(chunk_timeline)
+                            add_warnings(failures)
+                else:
+                    for raw in raws:
+                        event, failures = build_event(raw)
+                        timeline.append(event)
+                        add_warnings(failures)
+            finally:
+                # A scan stopped early still holds the mapping's buffer,
+                # which would make closing the mapping fail
+                raws.close()
 
     except FileNotFoundError:
         print(f"L Error: Log file not found: {log_file_path}", file=sys.stderr)
@@ -112,6 +319,10 @@ def main():
         '-o', '--output',
         help='Output file (default: {log_file}-timeline.json)'
     )
+    parser.add_argument(
+        '-j', '--jobs', type=int,
+        help='Worker processes for large logs (default: CPU count, 1 = serial)'
+    )
     args = parser.parse_args()
 
     log_file = Path(args.log_file)
@@ -127,25 +338,19 @@ def main():
     print(f"= Parsing Redux logs from {log_file}")
 
     # T055: Parse logs
-    timeline, warnings = parse_redux_logs(log_file)
+    timeline, warnings = parse_redux_logs(log_file, jobs=args.jobs)
 
     # T060: Generate metadata
-    successful_events = sum(1 for e in timeline if e.get('parsedSuccessfully', True))
-
-    output = {
-        'metadata': {
-            'logFile': str(log_file),
-            'parsedAt': datetime.now().isoformat(),
-            'totalEvents': len(timeline),
-            'successfulEvents': successful_events,
-            'warnings': warnings
-        },
-        'timeline': timeline
+    metadata = {
+        'logFile': str(log_file),
+        'parsedAt': datetime.now().isoformat(),
+        'totalEvents': len(timeline),
+        'successfulEvents': timeline.successful,
+        'warnings': warnings
     }
 
     # T061: Write output file
-    with open(output_file, 'w') as f:
-        json.dump(output, f, indent=2)
+    write_output(metadata, timeline, output_file)
 
     # T062: Final user output
     print(f" Extracted {len(timeline)} Redux events")
@@ -61,6 +61,13 @@ setup(
     install_requires=requirements,
     extras_require={
         "dev": dev_requirements,
+        # Optional accelerators, picked up automatically when installed
+        "speedups": [
+            "orjson>=3.9.0",
+            "uvloop>=0.19.0; sys_platform != 'win32'",
+            "pysimdjson>=5.0.0",
+            "pybase64>=1.3.0",
+        ],
     },
 
     # CLI entry point
@@ -4,6 +4,7 @@ Integration tests for CLI interface.
 Tests User Story 3: Unified CLI Interface - Help Text, Argument Validation
 """
 
+import asyncio
 import subprocess
 import sys
 import pytest
@@ -120,6 +121,53 @@ class TestCLIHelpText:
         assert "--method" in stdout
         assert "--params" in stdout
 
+    def test_repl_help(self):
+        """Test repl subcommand help."""
+        returncode, stdout, stderr = run_cli("repl", "--help")
+
+        assert returncode == 0
+        assert "single CDP connection" in stdout
+        assert "--target" in stdout
+        assert "--url" in stdout
+
+    def test_subcommand_imports_only_its_module(self):
+        """Test a subcommand invocation does not import the other subcommands."""
+        code = (
+            "import sys\n"
+            "from scripts.cdp.cli.main import main\n"
+            "try:\n"
+            "    main(['eval', '--help'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "print(' '.join(m for m in sys.modules if m.endswith('_cmd')), file=sys.stderr)\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0
+        assert result.stderr.split() == ["scripts.cdp.cli.eval_cmd"]
+
+    def test_find_subcommand(self):
+        """Test the subcommand is taken from the first argument only."""
+        from scripts.cdp.cli.main import find_subcommand
+
+        assert find_subcommand(["eval", "--url", "dom"]) == "eval"
+        assert find_subcommand(["--help", "eval"]) is None
+        assert find_subcommand(["bogus"]) is None
+        assert find_subcommand([]) is None
+
+    def test_subcommand_stub_help_matches_modules(self):
+        """Test SUBCOMMANDS help lines match what each module registers."""
+        from scripts.cdp.cli.main import SUBCOMMANDS, get_parser
+
+        subparsers = get_parser()._subparsers._group_actions[0]
+        registered = {
+            action.dest: action.help for action in subparsers._choices_actions
+        }
+
+        assert registered == SUBCOMMANDS
+
 
 class TestCLIMutualExclusion:
     """
@@ -200,6 +248,15 @@ class TestCLIMutualExclusion:
         assert returncode != 0
         assert "not allowed with argument" in stderr or "mutually exclusive" in stderr
 
+    def test_repl_target_url_mutual_exclusion(self):
+        """Test repl command rejects both --target and --url."""
+        returncode, stdout, stderr = run_cli(
+            "repl", "--target", "page-123", "--url", "example.com"
+        )
+
+        assert returncode != 0
+        assert "not allowed with argument" in stderr or "mutually exclusive" in stderr
+
     def test_global_quiet_verbose_mutual_exclusion(self):
         """Test --quiet and --verbose are mutually exclusive."""
         returncode, stdout, stderr = run_cli("session", "list", "--quiet", "--verbose")
@@ -275,6 +332,15 @@ class TestCLIMissingArguments:
         assert returncode != 0
         assert "required" in stderr.lower() or "method" in stderr.lower()
 
+    def test_query_invalid_params(self):
+        """Test query command rejects malformed --params before connecting."""
+        returncode, stdout, stderr = run_cli(
+            "query", "--method", "Runtime.evaluate", "--params", "{bad"
+        )
+
+        assert returncode == 2
+        assert "--params" in stderr and "invalid json" in stderr.lower()
+
     def test_session_missing_action(self):
         """Test session command requires action argument."""
         returncode, stdout, stderr = run_cli("session")
@@ -283,6 +349,85 @@ class TestCLIMissingArguments:
         assert "required" in stderr.lower() or "list" in stderr.lower()
 
 
+class TestCLIErrorOutput:
+    """Test error and status messages stay plain text on stderr."""
+
+    @pytest.mark.parametrize("output_format", ["json", "text"])
+    def test_connection_error_is_plain_text(self, output_format):
+        """Test a CDPError is reported as text with its recovery hint."""
+        # Nothing listens on port 1, so target discovery fails
+        returncode, stdout, stderr = run_cli(
+            "eval", "--chrome-port", "1", "--format", output_format, "1+1"
+        )
+
+        assert returncode == 1
+        assert stdout == ""
+        lines = stderr.splitlines()
+        assert lines[0].startswith("Error: Failed to connect to Chrome")
+        assert lines[1].startswith("Recovery hint: ")
+
+    def test_quiet_keeps_errors(self):
+        """Test --quiet still reports errors."""
+        returncode, stdout, stderr = run_cli("session", "list", "--chrome-port", "1", "--quiet")
+
+        assert returncode == 1
+        assert stderr.startswith("Error: ")
+
+
+class TestReplLines:
+    """Test how the repl runs one input line (no Chrome required)."""
+
+    @pytest.fixture
+    def run_line(self, monkeypatch):
+        """Run a repl line with the eval handler replaced by a recorder."""
+        from scripts.cdp.cli import eval_cmd
+        from scripts.cdp.cli.main import get_parser
+        from scripts.cdp.cli.repl_cmd import _run_line, create_line_parser
+
+        calls = []
+
+        async def fake_eval(args):
+            calls.append(args)
+            if args.expression == "raise":
+                raise FileNotFoundError("No such file or directory: '/missing/x'")
+            return 0
+
+        monkeypatch.setattr(eval_cmd, "eval_handler_async", fake_eval)
+        parser = create_line_parser()
+        repl_args = get_parser("repl").parse_args(
+            ["repl", "--chrome-port", "9333", "--timeout", "5", "--quiet"]
+        )
+
+        def run(line):
+            return asyncio.run(_run_line(parser, line, repl_args)), calls[-1]
+
+        return run
+
+    def test_line_inherits_unset_options(self, run_line):
+        """Test options a line does not set come from the repl invocation."""
+        exit_code, args = run_line("eval 1")
+
+        assert exit_code == 0
+        assert args.chrome_port == 9333
+        assert args.timeout == 5.0
+        assert args.quiet is True
+
+    def test_line_option_set_to_default_wins(self, run_line):
+        """Test an option given with its default value is not overridden."""
+        exit_code, args = run_line("eval --chrome-port 9222 --verbose 1")
+
+        assert exit_code == 0
+        assert args.chrome_port == 9222
+        assert args.timeout == 5.0
+        assert (args.quiet, args.verbose) == (False, True)
+
+    def test_handler_error_ends_only_the_line(self, run_line):
+        """Test an unexpected handler error is reported as exit code 1."""
+        exit_code, _ = run_line("eval raise")
+
+        assert exit_code == 1
+
+
 class TestCLICommandsWithChrome:
     """
     Integration tests for CLI commands with real Chrome.
@@ -12,6 +12,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from collections import deque
 
 from scripts.cdp.collectors.console import ConsoleCollector
+from scripts.cdp.collectors.network import NetworkCollector
 from scripts.cdp.connection import CDPConnection
 
 
@@ -79,7 +80,7 @@ async def test_console_collector_message_capture(tmp_path):
     await collector.start()
 
     # Simulate console message events
-    await collector._on_message(
+    collector._on_message(
         {
             "message": {
                 "timestamp": 1634567890.123,
@@ -91,7 +92,7 @@ async def test_console_collector_message_capture(tmp_path):
         }
     )
 
-    await collector._on_message(
+    collector._on_message(
         {
             "message": {
                 "timestamp": 1634567891.456,
@@ -107,7 +108,7 @@ async def test_console_collector_message_capture(tmp_path):
     assert len(collector._buffer) == 2
 
     # Verify entry format
-    first_entry = collector._buffer[0]
+    first_entry = json.loads(collector._buffer[0])
     assert first_entry["timestamp"] == 1634567890.123
     assert first_entry["level"] == "log"
     assert first_entry["text"] == "Hello, world!"
@@ -138,7 +139,7 @@ async def test_console_collector_level_filter(tmp_path):
     await collector.start()
 
     # Simulate log message (should be filtered out)
-    await collector._on_message(
+    collector._on_message(
         {
             "message": {
                 "timestamp": 1,
@@ -151,7 +152,7 @@ async def test_console_collector_level_filter(tmp_path):
     )
 
     # Simulate info message (should be filtered out)
-    await collector._on_message(
+    collector._on_message(
         {
             "message": {
                 "timestamp": 2,
@@ -164,7 +165,7 @@ async def test_console_collector_level_filter(tmp_path):
     )
 
     # Simulate warn message (should be captured)
-    await collector._on_message(
+    collector._on_message(
         {
             "message": {
                 "timestamp": 3,
@@ -177,7 +178,7 @@ async def test_console_collector_level_filter(tmp_path):
     )
 
     # Simulate error message (should be captured)
-    await collector._on_message(
+    collector._on_message(
         {
             "message": {
                 "timestamp": 4,
@@ -191,8 +192,8 @@ async def test_console_collector_level_filter(tmp_path):
 
     # Verify only warn and error were captured
     assert len(collector._buffer) == 2
-    assert collector._buffer[0]["level"] == "warn"
-    assert collector._buffer[1]["level"] == "error"
+    assert json.loads(collector._buffer[0])["level"] == "warn"
+    assert json.loads(collector._buffer[1])["level"] == "error"
 
     await collector.stop()
 
@@ -217,7 +218,7 @@ async def test_console_collector_bounded_buffer(tmp_path):
 
     # Add 1500 messages (exceeds buffer limit)
     for i in range(1500):
-        await collector._on_message(
+        collector._on_message(
             {
                 "message": {
                     "timestamp": i,
@@ -233,11 +234,11 @@ async def test_console_collector_bounded_buffer(tmp_path):
     assert len(collector._buffer) == 1000
 
     # Verify oldest entries were dropped (first message should be #500)
-    first_entry = collector._buffer[0]
+    first_entry = json.loads(collector._buffer[0])
     assert first_entry["text"] == "Message 500"
 
     # Verify latest entry is preserved
-    last_entry = collector._buffer[-1]
+    last_entry = json.loads(collector._buffer[-1])
     assert last_entry["text"] == "Message 1499"
 
     await collector.stop()
@@ -262,7 +263,7 @@ async def test_console_collector_flush_to_disk(tmp_path):
     await collector.start()
 
     # Add messages
-    await collector._on_message(
+    collector._on_message(
         {
             "message": {
                 "timestamp": 1,
@@ -274,7 +275,7 @@ async def test_console_collector_flush_to_disk(tmp_path):
         }
     )
 
-    await collector._on_message(
+    collector._on_message(
         {
             "message": {
                 "timestamp": 2,
@@ -287,7 +288,7 @@ async def test_console_collector_flush_to_disk(tmp_path):
     )
 
     # Flush to disk
-    collector._flush_to_disk()
+    await collector._flush_to_disk_async()
 
     # Verify buffer is cleared
     assert len(collector._buffer) == 0
@@ -314,6 +315,367 @@ async def test_console_collector_flush_to_disk(tmp_path):
     await collector.stop()
 
 
+@pytest.mark.asyncio
+async def test_console_collector_write_through(tmp_path):
+    """
+    Test writing entries straight to a caller-owned file.
+
+    Verifies:
+    - Entries go to output_file as they arrive, not to the buffer
+    - No periodic flush task is started
+    - Output is flushed on stop and the file is left open
+    """
+    mock_conn = AsyncMock(spec=CDPConnection)
+    mock_conn.execute_command = AsyncMock()
+    mock_conn.subscribe = MagicMock()
+
+    output_path = tmp_path / "console-logs.jsonl"
+    with open(output_path, "ab") as output_file:
+        collector = ConsoleCollector(
+            mock_conn, output_path=output_path, output_file=output_file
+        )
+        await collector.start()
+        assert collector._flush_task is None
+
+        for i in range(3):
+            collector._on_message(
+                {"message": {"timestamp": i, "level": "log", "text": f"msg {i}"}}
+            )
+
+        assert len(collector._buffer) == 0
+
+        await collector.stop()
+        assert not output_file.closed
+
+    lines = output_path.read_text().splitlines()
+    assert [json.loads(line)["text"] for line in lines] == ["msg 0", "msg 1", "msg 2"]
+
+
+@pytest.mark.asyncio
+async def test_network_collector_write_through(tmp_path):
+    """
+    Test NetworkCollector writing entries straight to a caller-owned file.
+
+    Verifies:
+    - Responses and failures go to output_file, not to the buffer
+    - No periodic flush task is started
+    - Output is flushed on stop and the file is left open
+    """
+    mock_conn = AsyncMock(spec=CDPConnection)
+    mock_conn.execute_command = AsyncMock()
+    mock_conn.subscribe = MagicMock()
+    mock_conn.unsubscribe = MagicMock()
+
+    output_path = tmp_path / "network-logs.jsonl"
+    with open(output_path, "ab") as output_file:
+        collector = NetworkCollector(
+            mock_conn, output_path=output_path, output_file=output_file
+        )
+        await collector.start()
+        assert collector._flush_task is None
+
+        collector._on_request(
+            {"requestId": "1", "request": {"url": "https://example.com/a"}}
+        )
+        collector._on_response(
+            {"requestId": "1", "response": {"status": 200, "statusText": "OK"}}
+        )
+        collector._on_request(
+            {"requestId": "2", "request": {"url": "https://example.com/b"}}
+        )
+        collector._on_loading_failed(
+            {"requestId": "2", "errorText": "net::ERR_FAILED"}
+        )
+
+        assert len(collector._buffer) == 0
+
+        await collector.stop()
+        assert not output_file.closed
+
+    entries = [json.loads(line) for line in output_path.read_text().splitlines()]
+    assert [entry["url"] for entry in entries] == [
+        "https://example.com/a",
+        "https://example.com/b",
+    ]
+    assert [entry["status"] for entry in entries] == [200, 0]
+
+
+@pytest.mark.asyncio
+async def test_network_collector_request_tracking_bounded():
+    """
+    Test that requests awaiting a response are tracked in a bounded LRU.
+
+    Verifies:
+    - The oldest request is evicted once the limit is exceeded
+    - A response for an evicted request still produces an entry
+    """
+    mock_conn = AsyncMock(spec=CDPConnection)
+    collector = NetworkCollector(mock_conn)
+
+    with patch("scripts.cdp.collectors.network.MAX_TRACKED_REQUESTS", 2):
+        for i in range(3):
+            collector._on_request(
+                {"requestId": str(i), "request": {"url": f"https://example.com/{i}"}}
+            )
+
+    assert list(collector._requests) == ["1", "2"]
+    assert collector._requests["2"].url == "https://example.com/2"
+
+    with patch("scripts.cdp.collectors.network._write_stdout") as write_stdout:
+        collector._on_response({"requestId": "0", "response": {"status": 200}})
+        collector._flush_stdout()
+
+    entry = json.loads(write_stdout.call_args[0][0])
+    assert entry["requestId"] == "0"
+    assert entry["method"] == "GET"
+
+
+@pytest.mark.asyncio
+async def test_network_collector_body_fetches_finish_on_stop(tmp_path):
+    """
+    Test response bodies are fetched in the background and flushed on stop.
+
+    Verifies:
+    - _on_response returns without waiting for Network.getResponseBody
+    - stop() waits for pending fetches before the final flush
+    """
+    mock_conn = AsyncMock(spec=CDPConnection)
+    mock_conn.subscribe = MagicMock()
+    mock_conn.unsubscribe = MagicMock()
+    release = asyncio.Event()
+
+    async def execute_command(method, params=None):
+        if method == "Network.getResponseBody":
+            await release.wait()
+            return {"body": f"body {params['requestId']}", "base64Encoded": False}
+        return {}
+
+    mock_conn.execute_command = AsyncMock(side_effect=execute_command)
+
+    output_file = tmp_path / "network-logs.jsonl"
+    collector = NetworkCollector(
+        mock_conn, output_path=output_file, include_bodies=True
+    )
+    await collector.start()
+
+    for request_id in ("1", "2"):
+        collector._on_response(
+            {"requestId": request_id, "response": {"status": 200, "mimeType": "text/html"}}
+        )
+
+    await asyncio.sleep(0)
+    assert len(collector._body_tasks) == 2
+    assert len(collector._buffer) == 0
+
+    release.set()
+    await collector.stop()
+
+    entries = [json.loads(line) for line in output_file.read_text().splitlines()]
+    assert sorted(entry["body"] for entry in entries) == ["body 1", "body 2"]
+    assert collector._body_tasks == set()
+
+
+class _EventConnection:
+    """Connection stand-in that dispatches events to live subscriptions."""
+
+    def __init__(self, execute_command):
+        self.execute_command = execute_command
+        self.handlers = {}
+
+    def subscribe(self, event, handler):
+        self.handlers.setdefault(event, []).append(handler)
+
+    def unsubscribe(self, event, handler):
+        self.handlers[event].remove(handler)
+
+    def dispatch(self, event, params):
+        for handler in list(self.handlers.get(event, ())):
+            handler(params)
+
+
+@pytest.mark.asyncio
+async def test_console_collector_message_during_stop(tmp_path):
+    """
+    Test a message arriving during the final flush is not left in the buffer.
+
+    Verifies:
+    - Handler is unsubscribed before stop() awaits the final write
+    - Nothing remains buffered once stop() returns
+    """
+    conn = _EventConnection(AsyncMock())
+    output_file = tmp_path / "console-logs.jsonl"
+    collector = ConsoleCollector(conn, output_path=output_file)
+
+    await collector.start()
+    conn.dispatch("Console.messageAdded", {"message": {"level": "log", "text": "a"}})
+
+    stopping = asyncio.create_task(collector.stop())
+    while collector._write_future is None:
+        await asyncio.sleep(0)
+    # The final snapshot is taken; Chrome keeps sending until the socket closes
+    conn.dispatch("Console.messageAdded", {"message": {"level": "log", "text": "b"}})
+    await stopping
+
+    assert conn.handlers["Console.messageAdded"] == []
+    assert len(collector._buffer) == 0
+    lines = output_file.read_text().splitlines()
+    assert [json.loads(line)["text"] for line in lines] == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_network_collector_response_during_stop(tmp_path):
+    """
+    Test a response arriving while stop() waits leaves no body task behind.
+
+    Verifies:
+    - Handlers are unsubscribed before stop() awaits the pending fetches
+    - No fetch outlives stop() to write into a file its owner then closes
+    """
+    release = asyncio.Event()
+
+    async def execute_command(method, params=None):
+        if method == "Network.getResponseBody":
+            await release.wait()
+            return {"body": f"body {params['requestId']}", "base64Encoded": False}
+        return {}
+
+    conn = _EventConnection(execute_command)
+    response = {"status": 200, "mimeType": "text/html"}
+
+    with open(tmp_path / "network-logs.jsonl", "ab") as output_file:
+        collector = NetworkCollector(
+            conn, include_bodies=True, output_file=output_file
+        )
+        await collector.start()
+        conn.dispatch(
+            "Network.responseReceived",
+            {"requestId": "1", "response": {**response, "url": "https://a.test/"}},
+        )
+
+        stopping = asyncio.create_task(collector.stop())
+        await asyncio.sleep(0)
+        # Chrome keeps sending events until the connection closes
+        conn.dispatch(
+            "Network.responseReceived",
+            {"requestId": "2", "response": {**response, "url": "https://b.test/"}},
+        )
+        release.set()
+        await stopping
+
+        assert collector._body_tasks == set()
+        assert conn.handlers["Network.responseReceived"] == []
+
+    lines = (tmp_path / "network-logs.jsonl").read_text().splitlines()
+    assert [json.loads(line)["body"] for line in lines] == ["body 1"]
+
+
+def test_network_collector_should_capture_body():
+    """Test body capture skips large and binary responses, not malformed ones."""
+    collector = NetworkCollector(MagicMock(), max_body_size=10)
+
+    def capture(headers, mime_type="text/html"):
+        return collector._should_capture_body(
+            {"headers": headers, "mimeType": mime_type}
+        )
+
+    assert capture({"Content-Length": "11"}) is False
+    assert capture({"content-length": "11"}) is False
+    assert capture({"content-length": "10"}) is True
+    assert capture({"content-length": "unknown"}) is True
+    assert capture({}, mime_type="image/png") is False
+
+
+@pytest.mark.asyncio
+async def test_console_collector_stdout_batching():
+    """
+    Test stdout streaming writes a burst of messages in one call.
+
+    Verifies:
+    - Messages are held until the flush delay passes
+    - Pending output is written on stop()
+    """
+    mock_conn = AsyncMock(spec=CDPConnection)
+    mock_conn.execute_command = AsyncMock()
+    mock_conn.subscribe = MagicMock()
+    mock_conn.unsubscribe = MagicMock()
+
+    collector = ConsoleCollector(mock_conn)
+    with patch("scripts.cdp.collectors.console._write_stdout") as write_stdout, \
+            patch("scripts.cdp.collectors.console.STDOUT_FLUSH_DELAY", 0.01):
+        await collector.start()
+
+        for i in range(3):
+            collector._on_message({"message": {"level": "log", "text": f"msg {i}"}})
+        write_stdout.assert_not_called()
+
+        await asyncio.sleep(0.05)
+        write_stdout.assert_called_once()
+        lines = bytes(write_stdout.call_args[0][0]).splitlines()
+        assert [json.loads(line)["text"] for line in lines] == ["msg 0", "msg 1", "msg 2"]
+
+        collector._on_message({"message": {"level": "log", "text": "last"}})
+        await collector.stop()
+
+    assert write_stdout.call_count == 2
+    assert json.loads(write_stdout.call_args[0][0])["text"] == "last"
+
+
+@pytest.mark.asyncio
+async def test_console_collector_max_entries(tmp_path):
+    """
+    Test ending collection once max_entries messages were captured.
+
+    Verifies:
+    - done is set when the quota is reached and wait() returns early
+    - Messages past the quota are ignored
+    - wait() returns False when the timeout elapses first
+    """
+    mock_conn = AsyncMock(spec=CDPConnection)
+    mock_conn.execute_command = AsyncMock()
+    mock_conn.subscribe = MagicMock()
+
+    collector = ConsoleCollector(
+        mock_conn, output_path=tmp_path / "console-logs.jsonl", max_entries=2
+    )
+    await collector.start()
+    assert await collector.wait(0.01) is False
+
+    for i in range(3):
+        collector._on_message({"message": {"level": "log", "text": f"msg {i}"}})
+
+    assert collector.done.is_set()
+    assert await collector.wait(10) is True
+    assert [json.loads(line)["text"] for line in collector._buffer] == ["msg 0", "msg 1"]
+
+
+@pytest.mark.asyncio
+async def test_console_collector_high_water_flush(tmp_path):
+    """
+    Test the buffer is flushed early once FLUSH_HIGH_WATER entries are pending.
+    """
+    mock_conn = AsyncMock(spec=CDPConnection)
+    mock_conn.execute_command = AsyncMock()
+    mock_conn.subscribe = MagicMock()
+
+    output_file = tmp_path / "console-logs.jsonl"
+    collector = ConsoleCollector(mock_conn, output_path=output_file)
+
+    with patch("scripts.cdp.collectors.console.FLUSH_HIGH_WATER", 3):
+        await collector.start()
+        for i in range(3):
+            collector._on_message({"message": {"level": "log", "text": f"msg {i}"}})
+
+        for _ in range(100):
+            if len(collector._buffer) == 0 and collector._write_future.done():
+                break
+            await asyncio.sleep(0.01)
+
+        assert len(output_file.read_text().splitlines()) == 3
+        assert len(collector._buffer) == 0
+
+        await collector.stop()
+
+
 @pytest.mark.asyncio
 async def test_console_collector_context_manager(tmp_path):
     """
@@ -336,7 +698,7 @@ async def test_console_collector_context_manager(tmp_path):
         assert collector._running
 
         # Add message
-        await collector._on_message(
+        collector._on_message(
             {
                 "message": {
                     "timestamp": 1,
@@ -383,7 +745,7 @@ async def test_console_collector_periodic_flush(tmp_path):
         assert collector._flush_task is not None
 
         # Add message
-        await collector._on_message(
+        collector._on_message(
             {
                 "message": {
                     "timestamp": 1,
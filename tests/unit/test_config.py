@@ -156,6 +156,24 @@ class TestConfigurationPrecedence:
             assert config.timeout == 30.0  # Default
             assert config.max_size == 2_097_152  # Default
 
+    def test_config_file_reparsed_after_change(self):
+        """Verify a cached config file is parsed again once it changes."""
+        with TemporaryDirectory() as tmpdir:
+            config_file = Path(tmpdir) / ".cdprc"
+            config_file.write_text(json.dumps({"chrome_port": 9333}))
+            os.utime(config_file, ns=(1_000_000_000, 1_000_000_000))
+
+            config = Configuration()
+            config.load_from_file(str(config_file))
+            assert config.chrome_port == 9333
+
+            config_file.write_text(json.dumps({"chrome_port": 9444}))
+            os.utime(config_file, ns=(2_000_000_000, 2_000_000_000))
+
+            config = Configuration()
+            config.load_from_file(str(config_file))
+            assert config.chrome_port == 9444
+
 
 class TestConfigurationTypes:
     """Test type conversion and validation."""
@@ -6,6 +6,7 @@ and error handling without requiring real Chrome.
 
 import asyncio
 import json
+import socket
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch, call
 from scripts.cdp.connection import CDPConnection
@@ -28,6 +29,9 @@ def create_mock_websocket():
     mock_state.name = "OPEN"
     mock_ws.state = mock_state
 
+    # Transport is synchronous; exposes the socket for TCP_NODELAY
+    mock_ws.transport = MagicMock()
+
     # Make async iterator that never yields (for tests that don't need messages)
     async def empty_iterator(self):
         # Just wait forever (tests will cancel via disconnect)
@@ -73,7 +77,13 @@ class TestCDPConnectionLifecycle:
 
         assert conn.is_connected
         mock_connect.assert_called_once_with(
-            "ws://localhost:9222/test", max_size=2_097_152
+            "ws://localhost:9222/test",
+            max_size=2_097_152,
+            compression=None,
+        )
+        sock = mock_ws.transport.get_extra_info.return_value
+        sock.setsockopt.assert_called_once_with(
+            socket.IPPROTO_TCP, socket.TCP_NODELAY, 1
         )
 
     @patch("scripts.cdp.connection.websockets.connect")
@@ -151,6 +161,73 @@ class TestCommandExecution:
             with pytest.raises(CDPTimeoutError, match="timed out"):
                 await conn.execute_command("Runtime.evaluate", {"expression": "test"})
 
+    @patch("scripts.cdp.connection.websockets.connect")
+    async def test_execute_many_pipelines_commands(self, mock_connect):
+        """Test execute_many sends every command before awaiting replies."""
+        mock_ws = create_mock_websocket()
+
+        async def async_connect(*args, **kwargs):
+            return mock_ws
+
+        mock_connect.side_effect = async_connect
+
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            sent = []
+
+            async def record_send(message):
+                sent.append(json.loads(message))
+                # Reply only once every command is on the wire
+                if len(sent) == 2:
+                    for msg in sent:
+                        conn._pending_commands[msg["id"]].set_result(
+                            {"method": msg["method"]}
+                        )
+
+            mock_ws.send.side_effect = record_send
+
+            results = await conn.execute_many(
+                [("Console.enable", None), ("Runtime.evaluate", {"expression": "1"})]
+            )
+
+            assert [msg["method"] for msg in sent] == ["Console.enable", "Runtime.evaluate"]
+            assert results == [
+                {"method": "Console.enable"},
+                {"method": "Runtime.evaluate"},
+            ]
+            assert "Console" in conn._enabled_domains
+            assert conn._pending_commands == {}
+
+    @patch("scripts.cdp.connection.websockets.connect")
+    async def test_execute_many_raises_first_failure(self, mock_connect):
+        """Test execute_many waits for all replies, then raises the first error."""
+        mock_ws = create_mock_websocket()
+
+        async def async_connect(*args, **kwargs):
+            return mock_ws
+
+        mock_connect.side_effect = async_connect
+
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            sent = []
+
+            async def record_send(message):
+                msg = json.loads(message)
+                sent.append(msg["method"])
+                future = conn._pending_commands[msg["id"]]
+                if msg["method"] == "IO.resolveBlob":
+                    future.set_exception(CommandFailedError("not found"))
+                else:
+                    future.set_result({})
+
+            mock_ws.send.side_effect = record_send
+
+            with pytest.raises(CommandFailedError, match="not found"):
+                await conn.execute_many(
+                    [("IO.resolveBlob", {}), ("Runtime.releaseObject", {})]
+                )
+
+            assert sent == ["IO.resolveBlob", "Runtime.releaseObject"]
+
     @patch("scripts.cdp.connection.websockets.connect")
     async def test_domain_tracking(self, mock_connect):
         """Test that enabled domains are tracked for replay."""
@@ -248,6 +325,50 @@ class TestEventSubscription:
             assert handler1 in handlers
             assert handler2 in handlers
 
+    @patch("scripts.cdp.connection.websockets.connect")
+    async def test_dispatch_sync_and_async_handlers(self, mock_connect):
+        """Test plain handlers run inline and async handlers as tasks."""
+        mock_ws = create_mock_websocket()
+        subscribed = asyncio.Event()
+        delivered = asyncio.Event()
+        sync_events = []
+        async_events = []
+
+        async def events(self):
+            await subscribed.wait()
+            for i in range(2):
+                yield json.dumps(
+                    {"method": "Console.messageAdded", "params": {"n": i}}
+                )
+            # Plain handlers already ran for every message at this point
+            sync_seen = list(sync_events)
+            delivered.set()
+            assert sync_seen == [{"n": 0}, {"n": 1}]
+            await asyncio.Event().wait()
+
+        mock_ws.__aiter__ = lambda self: events(self)
+
+        async def async_connect(*args, **kwargs):
+            return mock_ws
+
+        mock_connect.side_effect = async_connect
+
+        def sync_handler(params: dict):
+            sync_events.append(params)
+
+        async def async_handler(params: dict):
+            async_events.append(params)
+
+        async with CDPConnection("ws://localhost:9222/test") as conn:
+            conn.subscribe("Console.messageAdded", sync_handler)
+            conn.subscribe("Console.messageAdded", async_handler)
+            subscribed.set()
+            await asyncio.wait_for(delivered.wait(), timeout=1)
+            await asyncio.sleep(0)
+
+            assert sync_events == [{"n": 0}, {"n": 1}]
+            assert async_events == [{"n": 0}, {"n": 1}]
+
 
 @pytest.mark.unit
 @pytest.mark.asyncio
@@ -0,0 +1,81 @@
+"""Unit tests for the redux-logger timeline parser (parse-redux-logs.py)."""
+
+import importlib.util
+import json
+from pathlib import Path
+
+import pytest
+
+SCRIPT = Path(__file__).parents[2] / "scripts" / "utilities" / "parse-redux-logs.py"
+FIXTURE = Path(__file__).parents[1] / "fixtures" / "sample-redux-log.txt"
+
+
+@pytest.fixture(scope="module")
+def redux():
+    """Load the hyphen-named script as a module."""
+    spec = importlib.util.spec_from_file_location("parse_redux_logs", SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def run_parser(redux, log_file, tmp_path):
+    """Parse log_file serially and return the written output document."""
+    timeline, warnings = redux.parse_redux_logs(log_file, jobs=1)
+    output_file = tmp_path / "timeline.json"
+    metadata = {"totalEvents": len(timeline), "warnings": warnings}
+    redux.write_output(metadata, timeline, output_file)
+    return json.loads(output_file.read_text())
+
+
+class TestParseReduxLogs:
+    def test_sample_log(self, redux, tmp_path):
+        """Every action in the fixture becomes an event with parsed states."""
+        result = run_parser(redux, FIXTURE, tmp_path)
+
+        assert result["metadata"] == {"totalEvents": 3, "warnings": []}
+        first = result["timeline"][0]
+        assert first["actionType"] == "@app/customer/updateTempEmail"
+        assert first["nextState"]["customer"]["tempEmail"] == "test@example.com"
+        assert all(event["parsedSuccessfully"] for event in result["timeline"])
+
+    def test_integer_beyond_64_bits(self, redux, tmp_path):
+        """Big integers are parsed and written back exactly, not fatal."""
+        log_file = tmp_path / "console.log"
+        log_file.write_text(
+            "action @big @ 10:00:00.000\n"
+            f' next state {{"id": {2**70}}}\n'
+        )
+
+        result = run_parser(redux, log_file, tmp_path)
+
+        event = result["timeline"][0]
+        assert event["parsedSuccessfully"] is True
+        assert event["nextState"] == {"id": 2**70}
+
+    def test_non_finite_floats_round_trip(self, redux, tmp_path):
+        """NaN and Infinity are written back as such, not as null."""
+        log_file = tmp_path / "console.log"
+        log_file.write_text(
+            "action @nan @ 10:00:00.000\n"
+            ' next state {"ratio": NaN, "max": Infinity}\n'
+        )
+
+        timeline, _ = redux.parse_redux_logs(log_file, jobs=1)
+
+        assert b'"ratio": NaN' in timeline.data
+        assert b'"max": Infinity' in timeline.data
+
+    def test_malformed_state(self, redux, tmp_path):
+        """Unparseable state is kept as text and reported with its line."""
+        log_file = tmp_path / "console.log"
+        log_file.write_text(
+            "action @bad @ 10:00:00.000\n"
+            " prev state {not json\n"
+        )
+
+        result = run_parser(redux, log_file, tmp_path)
+
+        assert result["timeline"][0]["parsedSuccessfully"] is False
+        assert result["timeline"][0]["prevState"] == "{not json"
+        assert result["metadata"]["warnings"] == ["Line 2: Malformed prevState JSON"]
@@ -6,11 +6,16 @@ Tests User Story 3: Unified CLI Interface - Target Discovery
 
 import pytest
 import json
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from io import BytesIO
 
+from scripts.cdp import session as session_module
 from scripts.cdp.session import CDPSession, Target
-from scripts.cdp.exceptions import CDPError, CDPTargetNotFoundError
+from scripts.cdp.exceptions import (
+    CDPError,
+    CDPTargetNotFoundError,
+    ConnectionFailedError,
+)
 
 
 @pytest.fixture
@@ -379,3 +384,113 @@ async def test_connect_to_first_page_no_pages():
     with patch("urllib.request.urlopen", return_value=mock_response):
         with pytest.raises(CDPTargetNotFoundError, match="No page targets found"):
             await session.connect_to_first_page()
+
+
+@pytest.fixture
+def url_targets():
+    """Empty the per-process --url target cache around a test."""
+    session_module._url_targets.clear()
+    yield session_module._url_targets
+    session_module._url_targets.clear()
+
+
+def test_find_page_by_url_caches_lookup(mock_targets_response, url_targets):
+    """
+    Test find_page_by_url() reuses the resolved target within a process.
+
+    Verifies repeated lookups hit /json once and misses are not cached.
+    """
+    session = CDPSession()
+
+    mock_response = Mock()
+    mock_response.read.return_value = json.dumps(mock_targets_response).encode()
+    mock_response.__enter__ = Mock(return_value=mock_response)
+    mock_response.__exit__ = Mock(return_value=False)
+
+    with patch("urllib.request.urlopen", return_value=mock_response) as mock_urlopen:
+        assert session.find_page_by_url("github").id == "page-2"
+        assert CDPSession().find_page_by_url("github").id == "page-2"
+        assert mock_urlopen.call_count == 1
+
+        for _ in range(2):
+            with pytest.raises(CDPTargetNotFoundError):
+                session.find_page_by_url("nonexistent")
+        assert mock_urlopen.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_connect_to_url_retries_stale_target(mock_targets_response, url_targets):
+    """
+    Test connect_to_url() drops a stale cached target and retries once.
+    """
+    session = CDPSession()
+
+    mock_response = Mock()
+    mock_response.read.return_value = json.dumps(mock_targets_response).encode()
+    mock_response.__enter__ = Mock(return_value=mock_response)
+    mock_response.__exit__ = Mock(return_value=False)
+
+    connect = AsyncMock(side_effect=[ConnectionFailedError("gone"), None])
+    with patch("urllib.request.urlopen", return_value=mock_response) as mock_urlopen, \
+            patch("scripts.cdp.session.CDPConnection.connect", connect):
+        conn = await session.connect_to_url("example.com")
+
+    assert conn.ws_url == "ws://localhost:9222/devtools/page/page-1"
+    assert connect.await_count == 2
+    assert mock_urlopen.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_connect_to_url_rechecks_cached_target(mock_targets_response, url_targets):
+    """
+    Test connect_to_url() drops a cached target whose tab navigated away.
+
+    Verifies only that pattern's cache entry is replaced.
+    """
+    session = CDPSession()
+    url_targets[("localhost", 9222, "github")] = Target(mock_targets_response[1])
+    # page-2 was cached for "example.com" but has since left that site
+    url_targets[("localhost", 9222, "example.com")] = Target(mock_targets_response[1])
+
+    mock_response = Mock()
+    mock_response.read.return_value = json.dumps(mock_targets_response).encode()
+    mock_response.__enter__ = Mock(return_value=mock_response)
+    mock_response.__exit__ = Mock(return_value=False)
+
+    target_info = {"targetInfo": {"targetId": "page-2", "url": "https://github.com"}}
+    with patch("urllib.request.urlopen", return_value=mock_response) as mock_urlopen, \
+            patch("scripts.cdp.session.CDPConnection.connect", AsyncMock()), \
+            patch("scripts.cdp.session.CDPConnection.disconnect", AsyncMock()) as disconnect, \
+            patch(
+                "scripts.cdp.session.CDPConnection.execute_command",
+                AsyncMock(return_value=target_info),
+            ):
+        conn = await session.connect_to_url("example.com")
+
+    assert conn.ws_url == "ws://localhost:9222/devtools/page/page-1"
+    assert disconnect.await_count == 1
+    assert mock_urlopen.call_count == 1
+    assert url_targets[("localhost", 9222, "example.com")].id == "page-1"
+    assert url_targets[("localhost", 9222, "github")].id == "page-2"
+
+
+@pytest.mark.asyncio
+async def test_connect_to_url_reuses_matching_cached_target(mock_targets_response, url_targets):
+    """
+    Test connect_to_url() keeps a cached target that still matches, without /json.
+    """
+    session = CDPSession()
+    url_targets[("localhost", 9222, "github")] = Target(mock_targets_response[1])
+
+    target_info = {"targetInfo": {"targetId": "page-2", "url": "https://github.com/x"}}
+    with patch("urllib.request.urlopen") as mock_urlopen, \
+            patch("scripts.cdp.session.CDPConnection.connect", AsyncMock()), \
+            patch(
+                "scripts.cdp.session.CDPConnection.execute_command",
+                AsyncMock(return_value=target_info),
+            ) as execute:
+        conn = await session.connect_to_url("github")
+
+    assert conn.ws_url == "ws://localhost:9222/devtools/page/page-2"
+    execute.assert_awaited_once_with("Target.getTargetInfo")
+    mock_urlopen.assert_not_called()